@@ -6,15 +6,11 @@ This example demonstrates complex profile inheritance patterns and
 advanced configuration management scenarios.
 """
 
-from pathlib import Path
-
 from profile_config import ProfileConfigResolver
 from profile_config.exceptions import CircularInheritanceError, ProfileNotFoundError
 
-
-def create_complex_config():
-    """Create a complex configuration with multi-level inheritance."""
-    config_content = """
+# Complex configuration with multi-level inheritance
+COMPLEX_CONFIG = """
 # Global defaults
 defaults:
   timeout: 30
@@ -106,120 +102,97 @@ profiles:
       feature_c: true
 """
 
-    # Create config directory and file
-    config_dir = Path("complex-app")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(config_content)
 
-    print(f"Created complex config at: {config_file.absolute()}")
-    return config_file
+def print_config(config):
+    """Print a resolved configuration, one level of nesting deep, in key order."""
+    for key in sorted(config):
+        value = config[key]
+        if isinstance(value, dict):
+            print(f"   {key}:")
+            for sub_key in sorted(value):
+                print(f"     {sub_key}: {value[sub_key]}")
+        else:
+            print(f"   {key}: {value}")
+    print()
 
 
 def demonstrate_inheritance_chain():
     """Demonstrate complex inheritance chains."""
     print("=== Complex Inheritance Chain Example ===\n")
 
-    config_file = create_complex_config()
+    # Show inheritance chain for production
+    print("1. Production profile inheritance chain:")
+    print("   production -> prod_base -> base -> defaults")
+    print()
 
-    try:
-        # Show inheritance chain for production
-        print("1. Production profile inheritance chain:")
-        print("   production -> prod_base -> base -> defaults")
-        print()
-
-        resolver = ProfileConfigResolver("complex-app", profile="production")
-        prod_config = resolver.resolve()
-
-        print("   Resolved production configuration:")
-        for key, value in sorted(prod_config.items()):
-            if isinstance(value, dict):
-                print(f"   {key}:")
-                for sub_key, sub_value in sorted(value.items()):
-                    print(f"     {sub_key}: {sub_value}")
-            else:
-                print(f"   {key}: {value}")
-        print()
-
-        # Compare with local development
-        print("2. Local development profile inheritance chain:")
-        print("   local -> dev_base -> base -> defaults")
-        print()
-
-        resolver = ProfileConfigResolver("complex-app", profile="local")
-        local_config = resolver.resolve()
-
-        print("   Resolved local configuration:")
-        for key, value in sorted(local_config.items()):
-            if isinstance(value, dict):
-                print(f"   {key}:")
-                for sub_key, sub_value in sorted(value.items()):
-                    print(f"     {sub_key}: {sub_value}")
-            else:
-                print(f"   {key}: {value}")
-        print()
-
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
+    resolver = ProfileConfigResolver.from_string(
+        COMPLEX_CONFIG, "complex-app", profile="production"
+    )
+    prod_config = resolver.resolve()
+
+    print("   Resolved production configuration:")
+    print_config(prod_config)
+
+    # Compare with local development
+    print("2. Local development profile inheritance chain:")
+    print("   local -> dev_base -> base -> defaults")
+    print()
+
+    resolver = ProfileConfigResolver.from_string(
+        COMPLEX_CONFIG, "complex-app", profile="local"
+    )
+    local_config = resolver.resolve()
+
+    print("   Resolved local configuration:")
+    print_config(local_config)
 
 
 def demonstrate_profile_comparison():
     """Demonstrate comparing different profiles."""
     print("=== Profile Comparison Example ===\n")
 
-    config_file = create_complex_config()
+    profiles_to_compare = ["local", "staging", "production"]
 
-    try:
-        profiles_to_compare = ["local", "staging", "production"]
-        configs = {}
+    # Resolve all profiles, loading the configuration only once
+    resolver = ProfileConfigResolver.from_string(COMPLEX_CONFIG, "complex-app")
+    configs = resolver.resolve_many(profiles_to_compare)
+
+    # Compare specific settings
+    print("Database configuration comparison:")
+    print(f"{'Setting':<15} {'Local':<20} {'Staging':<20} {'Production':<20}")
+    print("-" * 80)
 
-        # Resolve all profiles
+    db_settings = ["driver", "host", "name", "port", "pool_size"]
+    for setting in db_settings:
+        values = []
         for profile in profiles_to_compare:
-            resolver = ProfileConfigResolver("complex-app", profile=profile)
-            configs[profile] = resolver.resolve()
-
-        # Compare specific settings
-        print("Database configuration comparison:")
-        print(f"{'Setting':<15} {'Local':<20} {'Staging':<20} {'Production':<20}")
-        print("-" * 80)
-
-        db_settings = ["driver", "host", "name", "port", "pool_size"]
-        for setting in db_settings:
-            values = []
-            for profile in profiles_to_compare:
-                db_config = configs[profile].get("database", {})
-                value = db_config.get(setting, "N/A")
-                values.append(str(value)[:19])  # Truncate for display
-
-            print(f"{setting:<15} {values[0]:<20} {values[1]:<20} {values[2]:<20}")
-        print()
-
-        # Compare feature flags
-        print("Feature flags comparison:")
-        print(f"{'Feature':<15} {'Local':<10} {'Staging':<10} {'Production':<10}")
-        print("-" * 50)
-
-        all_features = set()
-        for config in configs.values():
-            features = config.get("features", {})
-            all_features.update(features.keys())
-
-        for feature in sorted(all_features):
-            values = []
-            for profile in profiles_to_compare:
-                features = configs[profile].get("features", {})
-                value = features.get(feature, False)
-                values.append(str(value))
-
-            print(f"{feature:<15} {values[0]:<10} {values[1]:<10} {values[2]:<10}")
-        print()
-
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
+            db_config = configs[profile].get("database", {})
+            value = db_config.get(setting, "N/A")
+            values.append(str(value))
+
+        # Precision truncates to 19 characters while padding to 20
+        print(f"{setting:<15} {values[0]:<20.19} {values[1]:<20.19} {values[2]:<20.19}")
+    print()
+
+    # Compare feature flags
+    print("Feature flags comparison:")
+    print(f"{'Feature':<15} {'Local':<10} {'Staging':<10} {'Production':<10}")
+    print("-" * 50)
+
+    all_features = set()
+    for config in configs.values():
+        features = config.get("features", {})
+        all_features.update(features.keys())
+
+    for feature in sorted(all_features):
+        values = []
+        for profile in profiles_to_compare:
+            features = configs[profile].get("features", {})
+            value = features.get(feature, False)
+            values.append(str(value))
+
+        print(f"{feature:<15} {values[0]:<10} {values[1]:<10} {values[2]:<10}")
+    print()
 
 
 def demonstrate_error_handling():
@@ -241,39 +214,32 @@ profiles:
     value: c_value
 """
 
-    config_dir = Path("error-demo")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(circular_config)
+    resolver = ProfileConfigResolver.from_string(
+        circular_config, "error-demo", profile="a"
+    )
+    try:
+        resolver.resolve()
+    except CircularInheritanceError as e:
+        print(f"   Caught CircularInheritanceError: {e}")
+    print()
 
+    # Example 2: Nonexistent profile
+    print("2. Nonexistent profile handling:")
     try:
-        resolver = ProfileConfigResolver("error-demo", profile="a")
-        try:
-            resolver.resolve()
-        except CircularInheritanceError as e:
-            print(f"   Caught CircularInheritanceError: {e}")
-        print()
-
-        # Example 2: Nonexistent profile
-        print("2. Nonexistent profile handling:")
-        try:
-            resolver = ProfileConfigResolver("error-demo", profile="nonexistent")
-            resolver.resolve()
-        except ProfileNotFoundError as e:
-            print(f"   Caught ProfileNotFoundError: {e}")
-        print()
-
-        # Example 3: Profile listing for debugging
-        print("3. Available profiles for debugging:")
-        resolver = ProfileConfigResolver("error-demo")
-        profiles = resolver.list_profiles()
-        print(f"   Available profiles: {profiles}")
-        print()
-
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
+        resolver = ProfileConfigResolver.from_string(
+            circular_config, "error-demo", profile="nonexistent"
+        )
+        resolver.resolve()
+    except ProfileNotFoundError as e:
+        print(f"   Caught ProfileNotFoundError: {e}")
+    print()
+
+    # Example 3: Profile listing for debugging
+    print("3. Available profiles for debugging:")
+    resolver = ProfileConfigResolver.from_string(circular_config, "error-demo")
+    profiles = resolver.list_profiles()
+    print(f"   Available profiles: {profiles}")
+    print()
 
 
 def demonstrate_custom_inheritance_key():
@@ -292,28 +258,13 @@ profiles:
     port: 3000
 """
 
-    config_dir = Path("custom-key-demo")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(config_content)
-
-    try:
-        # This would fail with default inherit_key
-        print("Using custom inheritance key 'extends':")
-
-        resolver = ProfileConfigResolver(
-            "custom-key-demo", profile="development", inherit_key="extends"
-        )
-        config = resolver.resolve()
-
-        for key, value in sorted(config.items()):
-            print(f"   {key}: {value}")
-        print()
+    # This would fail with default inherit_key
+    print("Using custom inheritance key 'extends':")
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
+    resolver = ProfileConfigResolver.from_string(
+        config_content, "custom-key-demo", profile="development", inherit_key="extends"
+    )
+    print_config(resolver.resolve())
 
 
 if __name__ == "__main__":
@@ -6,14 +6,17 @@ This example demonstrates the fundamental usage patterns of the profile-config
 library for hierarchical configuration management.
 """
 
-import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
+from example_utils import temporary_config
+
 from profile_config import ProfileConfigResolver
 
 
-def create_sample_config():
+@contextmanager
+def sample_config():
     """Create a sample configuration file for demonstration."""
     config_content = """
 # Default configuration values
@@ -46,14 +49,9 @@ profiles:
     timeout: 60
 """
 
-    # Create config directory and file
-    config_dir = Path("myapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(config_content)
-
-    print(f"Created sample config at: {config_file.absolute()}")
-    return config_file
+    with temporary_config("myapp", config_content) as tmpdir:
+        print(f"Created sample config at: {tmpdir / 'myapp' / 'config.yaml'}")
+        yield tmpdir
 
 
 def demonstrate_basic_usage():
@@ -61,12 +59,12 @@ def demonstrate_basic_usage():
     print("=== Basic Usage Example ===\n")
 
     # Create sample configuration
-    config_file = create_sample_config()
-
-    try:
+    with sample_config() as tmpdir:
         # Example 1: Resolve development profile
         print("1. Resolving 'development' profile:")
-        resolver = ProfileConfigResolver("myapp", profile="development")
+        resolver = ProfileConfigResolver(
+            "myapp", profile="development", start_dir=tmpdir
+        )
         dev_config = resolver.resolve()
 
         for key, value in sorted(dev_config.items()):
@@ -75,7 +73,7 @@ def demonstrate_basic_usage():
 
         # Example 2: Resolve staging profile (with inheritance)
         print("2. Resolving 'staging' profile (inherits from development):")
-        resolver = ProfileConfigResolver("myapp", profile="staging")
+        resolver = ProfileConfigResolver("myapp", profile="staging", start_dir=tmpdir)
         staging_config = resolver.resolve()
 
         for key, value in sorted(staging_config.items()):
@@ -84,7 +82,9 @@ def demonstrate_basic_usage():
 
         # Example 3: Resolve production profile
         print("3. Resolving 'production' profile:")
-        resolver = ProfileConfigResolver("myapp", profile="production")
+        resolver = ProfileConfigResolver(
+            "myapp", profile="production", start_dir=tmpdir
+        )
         prod_config = resolver.resolve()
 
         for key, value in sorted(prod_config.items()):
@@ -105,7 +105,7 @@ def demonstrate_basic_usage():
             "custom_setting": "runtime_value",
         }
         resolver = ProfileConfigResolver(
-            "myapp", profile="development", overrides=overrides
+            "myapp", profile="development", overrides=overrides, start_dir=tmpdir
         )
         override_config = resolver.resolve()
 
@@ -113,11 +113,6 @@ def demonstrate_basic_usage():
             print(f"   {key}: {value}")
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_variable_interpolation():
     """Demonstrate variable interpolation features."""
@@ -140,48 +135,36 @@ profiles:
     database_url: postgresql://prod-db/${app_name}
 """
 
-    # Create config directory and file
-    config_dir = Path("interpolation-demo")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(config_content)
-
-    try:
+    with temporary_config("interpolation-demo", config_content) as tmpdir:
         print("Configuration with variable interpolation:")
 
         # Resolve development profile
-        resolver = ProfileConfigResolver("interpolation-demo", profile="development")
+        resolver = ProfileConfigResolver(
+            "interpolation-demo", profile="development", start_dir=tmpdir
+        )
         config = resolver.resolve()
 
         for key, value in sorted(config.items()):
             print(f"   {key}: {value}")
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_hierarchical_discovery():
     """Demonstrate hierarchical configuration file discovery."""
     print("=== Hierarchical Discovery Example ===\n")
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        original_cwd = os.getcwd()
-
-        try:
-            # Create nested directory structure
-            base_dir = Path(tmpdir)
-            project_dir = base_dir / "project"
-            sub_dir = project_dir / "subproject"
-            sub_dir.mkdir(parents=True)
-
-            # Create base configuration
-            base_config_dir = base_dir / "myapp"
-            base_config_dir.mkdir()
-            base_config = base_config_dir / "config.yaml"
-            base_config.write_text("""
+        # Create nested directory structure
+        base_dir = Path(tmpdir)
+        project_dir = base_dir / "project"
+        sub_dir = project_dir / "subproject"
+        sub_dir.mkdir(parents=True)
+
+        # Create base configuration
+        base_config_dir = base_dir / "myapp"
+        base_config_dir.mkdir()
+        base_config = base_config_dir / "config.yaml"
+        base_config.write_text("""
 defaults:
   level: base
   timeout: 30
@@ -191,11 +174,11 @@ profiles:
     debug: true
 """)
 
-            # Create project-level configuration
-            project_config_dir = project_dir / "myapp"
-            project_config_dir.mkdir()
-            project_config = project_config_dir / "config.yaml"
-            project_config.write_text("""
+        # Create project-level configuration
+        project_config_dir = project_dir / "myapp"
+        project_config_dir.mkdir()
+        project_config = project_config_dir / "config.yaml"
+        project_config.write_text("""
 defaults:
   level: project
   port: 8080
@@ -206,33 +189,27 @@ profiles:
     custom_setting: project_value
 """)
 
-            # Change to subdirectory
-            os.chdir(sub_dir)
-
-            print("Directory structure:")
-            print(f"   Base: {base_config}")
-            print(f"   Project: {project_config}")
-            print(f"   Current: {sub_dir}")
-            print()
-
-            # Resolve configuration (should find both files)
-            resolver = ProfileConfigResolver("myapp", profile="dev")
-            config = resolver.resolve()
-
-            print("Resolved configuration (project overrides base):")
-            for key, value in sorted(config.items()):
-                print(f"   {key}: {value}")
-            print()
-
-            # Show discovered files
-            files = resolver.get_config_files()
-            print("Discovered configuration files (in precedence order):")
-            for i, file_path in enumerate(files, 1):
-                print(f"   {i}. {file_path}")
-            print()
-
-        finally:
-            os.chdir(original_cwd)
+        print("Directory structure:")
+        print(f"   Base: {base_config}")
+        print(f"   Project: {project_config}")
+        print(f"   Search start: {sub_dir}")
+        print()
+
+        # Resolve from the subdirectory (should find both files)
+        resolver = ProfileConfigResolver("myapp", profile="dev", start_dir=sub_dir)
+        config = resolver.resolve()
+
+        print("Resolved configuration (project overrides base):")
+        for key, value in sorted(config.items()):
+            print(f"   {key}: {value}")
+        print()
+
+        # Show discovered files
+        files = resolver.get_config_files()
+        print("Discovered configuration files (in precedence order):")
+        for i, file_path in enumerate(files, 1):
+            print(f"   {i}. {file_path}")
+        print()
 
 
 if __name__ == "__main__":
@@ -6,9 +6,7 @@ This example shows how the "default" profile works with and without
 explicit definition in the configuration file.
 """
 
-import os
-import tempfile
-from pathlib import Path
+from example_utils import temporary_config
 
 from profile_config import ProfileConfigResolver
 
@@ -44,44 +42,29 @@ profiles:
     print(config_content)
     print("-" * 70)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Save current directory
-        original_dir = os.getcwd()
+    # Resolve default profile (auto-created)
+    resolver = ProfileConfigResolver.from_string(
+        config_content, "myapp", profile="default"
+    )
+    config = resolver.resolve()
 
-        try:
-            # Create config file
-            os.chdir(tmpdir)
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text(config_content)
-
-            # Resolve default profile (auto-created)
-            resolver = ProfileConfigResolver(
-                "myapp", profile="default", search_home=False
-            )
-            config = resolver.resolve()
-
-            print("\nResult with profile='default' (auto-created):")
-            print("-" * 70)
-            for key, value in sorted(config.items()):
-                print(f"  {key}: {value}")
-            print()
-
-            # Compare with development profile
-            resolver_dev = ProfileConfigResolver(
-                "myapp", profile="development", search_home=False
-            )
-            config_dev = resolver_dev.resolve()
+    print("\nResult with profile='default' (auto-created):")
+    print("-" * 70)
+    for key, value in sorted(config.items()):
+        print(f"  {key}: {value}")
+    print()
 
-            print("\nCompare with profile='development':")
-            print("-" * 70)
-            for key, value in sorted(config_dev.items()):
-                print(f"  {key}: {value}")
-            print()
+    # Compare with development profile
+    resolver_dev = ProfileConfigResolver.from_string(
+        config_content, "myapp", profile="development"
+    )
+    config_dev = resolver_dev.resolve()
 
-        finally:
-            os.chdir(original_dir)
+    print("\nCompare with profile='development':")
+    print("-" * 70)
+    for key, value in sorted(config_dev.items()):
+        print(f"  {key}: {value}")
+    print()
 
 
 def demo_explicit_default():
@@ -117,42 +100,30 @@ profiles:
     print(config_content)
     print("-" * 70)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        original_dir = os.getcwd()
-
-        try:
-            os.chdir(tmpdir)
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text(config_content)
-
-            # Resolve explicit default profile
-            resolver = ProfileConfigResolver(
-                "myapp", profile="default", search_home=False
-            )
-            config = resolver.resolve()
-
-            print("\nResult with profile='default' (explicit definition):")
-            print("-" * 70)
-            for key, value in sorted(config.items()):
-                print(f"  {key}: {value}")
-            print()
+    with temporary_config("myapp", config_content) as tmpdir:
+        # Resolve explicit default profile
+        resolver = ProfileConfigResolver(
+            "myapp", profile="default", search_home=False, start_dir=tmpdir
+        )
+        config = resolver.resolve()
 
-            # Show development inheriting from default
-            resolver_dev = ProfileConfigResolver(
-                "myapp", profile="development", search_home=False
-            )
-            config_dev = resolver_dev.resolve()
+        print("\nResult with profile='default' (explicit definition):")
+        print("-" * 70)
+        for key, value in sorted(config.items()):
+            print(f"  {key}: {value}")
+        print()
 
-            print("\nResult with profile='development' (inherits from default):")
-            print("-" * 70)
-            for key, value in sorted(config_dev.items()):
-                print(f"  {key}: {value}")
-            print()
+        # Show development inheriting from default
+        resolver_dev = ProfileConfigResolver(
+            "myapp", profile="development", search_home=False, start_dir=tmpdir
+        )
+        config_dev = resolver_dev.resolve()
 
-        finally:
-            os.chdir(original_dir)
+        print("\nResult with profile='development' (inherits from default):")
+        print("-" * 70)
+        for key, value in sorted(config_dev.items()):
+            print(f"  {key}: {value}")
+        print()
 
 
 def demo_environment_fallback():
@@ -177,42 +148,30 @@ profiles:
     log_level: WARNING
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        original_dir = os.getcwd()
-
-        try:
-            os.chdir(tmpdir)
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text(config_content)
-
-            # Simulate different environment variables
-            test_cases = [
-                ("development", "Development environment"),
-                ("production", "Production environment"),
-                (None, "No environment specified (falls back to default)"),
-            ]
-
-            for env_value, description in test_cases:
-                print(f"\n{description}:")
-                print("-" * 70)
-
-                # Simulate environment variable
-                env = env_value if env_value else "default"
-
-                resolver = ProfileConfigResolver(
-                    "myapp", profile=env, search_home=False
-                )
-                config = resolver.resolve()
-
-                print(f"Profile used: {env}")
-                for key, value in sorted(config.items()):
-                    print(f"  {key}: {value}")
-            print()
-
-        finally:
-            os.chdir(original_dir)
+    with temporary_config("myapp", config_content) as tmpdir:
+        # Simulate different environment variables
+        test_cases = [
+            ("development", "Development environment"),
+            ("production", "Production environment"),
+            (None, "No environment specified (falls back to default)"),
+        ]
+
+        for env_value, description in test_cases:
+            print(f"\n{description}:")
+            print("-" * 70)
+
+            # Simulate environment variable
+            env = env_value if env_value else "default"
+
+            resolver = ProfileConfigResolver(
+                "myapp", profile=env, search_home=False, start_dir=tmpdir
+            )
+            config = resolver.resolve()
+
+            print(f"Profile used: {env}")
+            for key, value in sorted(config.items()):
+                print(f"  {key}: {value}")
+        print()
 
 
 def main():
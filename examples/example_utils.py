@@ -0,0 +1,23 @@
+"""
+Helpers shared by the profile-config examples.
+"""
+
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def temporary_config(config_name, content, filename="config.yaml"):
+    """
+    Write a configuration file into a new temporary directory.
+
+    Yields the temporary directory; the file is at
+    <directory>/<config_name>/<filename>. Pass the directory as start_dir so
+    the resolver finds the file without changing the working directory.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = Path(tmpdir) / config_name / filename
+        config_file.parent.mkdir()
+        config_file.write_text(content)
+        yield Path(tmpdir)
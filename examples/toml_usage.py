@@ -6,14 +6,15 @@ This example demonstrates how to use profile-config with TOML format
 configuration files, showcasing TOML-specific syntax and features.
 """
 
-import os
-import tempfile
-from pathlib import Path
+from contextlib import contextmanager
+
+from example_utils import temporary_config
 
 from profile_config import ProfileConfigResolver
 
 
-def create_toml_config():
+@contextmanager
+def toml_config():
     """Create a comprehensive TOML configuration file."""
     toml_content = """
 # TOML Configuration Example
@@ -143,26 +144,19 @@ email_verification = true
 social_login = true
 """
 
-    # Create config directory and file
-    config_dir = Path("myapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.toml"
-    config_file.write_text(toml_content)
-
-    return config_file
+    with temporary_config("myapp", toml_content, "config.toml") as tmpdir:
+        yield tmpdir
 
 
 def demonstrate_toml_features():
     """Demonstrate TOML-specific features and syntax."""
     print("=== TOML Configuration Features ===\n")
 
-    config_file = create_toml_config()
-
-    try:
+    with toml_config() as tmpdir:
         # Example 1: Basic TOML loading
         print("1. Loading TOML Configuration:")
         resolver = ProfileConfigResolver(
-            "myapp", profile="development", search_home=False
+            "myapp", profile="development", search_home=False, start_dir=tmpdir
         )
         config = resolver.resolve()
 
@@ -199,11 +193,9 @@ def demonstrate_toml_features():
         print("   Profile      Host                    Database        Pool Size")
         print("   " + "-" * 65)
 
-        for profile in profiles:
-            resolver = ProfileConfigResolver(
-                "myapp", profile=profile, search_home=False
-            )
-            config = resolver.resolve()
+        # Parse the TOML file once and resolve every profile from it
+        resolver = ProfileConfigResolver("myapp", search_home=False, start_dir=tmpdir)
+        for profile, config in resolver.resolve_many(profiles).items():
             db = config["database"]
             pool_size = db.get("pool_size", "N/A")
             print(f"   {profile:<12} {db['host']:<23} {db['name']:<15} {pool_size}")
@@ -235,11 +227,6 @@ def demonstrate_toml_features():
         print("   ```")
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_toml_variable_interpolation():
     """Demonstrate variable interpolation with TOML."""
@@ -267,21 +254,14 @@ environment = "prod"
 base_path = "/var/lib/${app_name}"
 """
 
-    config_dir = Path("myapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.toml"
-    config_file.write_text(toml_content)
-
-    try:
+    with temporary_config("myapp", toml_content, "config.toml") as tmpdir:
         print("Variable interpolation with different profiles:")
         print()
 
-        for profile in ["development", "production"]:
+        resolver = ProfileConfigResolver("myapp", search_home=False, start_dir=tmpdir)
+        configs = resolver.resolve_many(["development", "production"])
+        for profile, config in configs.items():
             print(f"Profile: {profile}")
-            resolver = ProfileConfigResolver(
-                "myapp", profile=profile, search_home=False
-            )
-            config = resolver.resolve()
 
             print(f"   Base path: {config['base_path']}")
             print(f"   Data path: {config['data_path']}")
@@ -290,11 +270,6 @@ base_path = "/var/lib/${app_name}"
             print(f"   Database URL: {config['database']['url']}")
             print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_toml_data_types():
     """Demonstrate TOML data type support."""
@@ -341,13 +316,8 @@ ip = "192.168.1.2"
 active = false
 '''
 
-    config_dir = Path("myapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.toml"
-    config_file.write_text(toml_content)
-
-    try:
-        resolver = ProfileConfigResolver("myapp", search_home=False)
+    with temporary_config("myapp", toml_content, "config.toml") as tmpdir:
+        resolver = ProfileConfigResolver("myapp", search_home=False, start_dir=tmpdir)
         config = resolver.resolve()
 
         print("TOML supports rich data types:")
@@ -370,11 +340,6 @@ active = false
             print(f"     {status} {server['name']}: {server['ip']}")
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_toml_error_handling():
     """Demonstrate TOML error handling."""
@@ -387,15 +352,11 @@ def demonstrate_toml_error_handling():
 missing_bracket = "this will fail"
 """
 
-    config_dir = Path("myapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.toml"
-
-    try:
-        config_file.write_text(invalid_toml)
-
+    with temporary_config("myapp", invalid_toml, "config.toml") as tmpdir:
         try:
-            resolver = ProfileConfigResolver("myapp", search_home=False)
+            resolver = ProfileConfigResolver(
+                "myapp", search_home=False, start_dir=tmpdir
+            )
             config = resolver.resolve()
             print("   ERROR: Should have failed!")
         except Exception as e:
@@ -413,11 +374,11 @@ app_name = "myapp"
 debug = true
 """
 
-        config_file.write_text(valid_toml)
+        (tmpdir / "myapp" / "config.toml").write_text(valid_toml)
 
         try:
             resolver = ProfileConfigResolver(
-                "myapp", profile="nonexistent", search_home=False
+                "myapp", profile="nonexistent", search_home=False, start_dir=tmpdir
             )
             config = resolver.resolve()
             print("   ERROR: Should have failed!")
@@ -426,13 +387,6 @@ debug = true
             print(f"   Message: {str(e)}")
         print()
 
-    finally:
-        # Cleanup
-        if config_file.exists():
-            config_file.unlink()
-        if config_dir.exists():
-            config_dir.rmdir()
-
 
 if __name__ == "__main__":
     demonstrate_toml_features()
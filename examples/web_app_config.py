@@ -7,22 +7,68 @@ web application with different deployment environments.
 """
 
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
+
+from example_utils import temporary_config
 
 from profile_config import ProfileConfigResolver
 
+# Environment variables and the (pre-split) configuration keys they override
+ENV_MAPPINGS = (
+    ("DATABASE_URL", ("database", "url")),
+    ("REDIS_URL", ("cache", "redis_url")),
+    ("SECRET_KEY", ("security", "secret_key")),
+    ("DEBUG", ("debug",)),
+    ("PORT", ("server", "port")),
+    ("LOG_LEVEL", ("logging", "level")),
+)
+
+BOOLEAN_STRINGS = {"true": True, "false": False}
+
+
+def iter_flat(config: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield (dot-separated path, value) for every section and value in config."""
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from iter_flat(value, f"{path}.")
+
+
+def set_path(config: Dict[str, Any], keys: Tuple[str, ...], value: Any) -> None:
+    """Set a nested configuration value, creating parent sections as needed."""
+    # Every mapping above is one or two levels deep, so those are unrolled
+    if len(keys) == 1:
+        config[keys[0]] = value
+    elif len(keys) == 2:
+        config.setdefault(keys[0], {})[keys[1]] = value
+    else:
+        for key in keys[:-1]:
+            config = config.setdefault(key, {})
+        config[keys[-1]] = value
+
 
 class WebAppConfig:
     """Web application configuration manager using profile-config."""
 
-    def __init__(self, profile: str = None, config_overrides: Dict[str, Any] = None):
+    __slots__ = ("profile", "resolver", "_config", "_flat")
+
+    def __init__(
+        self,
+        profile: str = None,
+        config_overrides: Dict[str, Any] = None,
+        start_dir: Path = None,
+    ):
         """
         Initialize web application configuration.
 
         Args:
             profile: Configuration profile to use (default: from environment)
             config_overrides: Runtime configuration overrides
+            start_dir: Directory to search for configuration from
+                (default: the current working directory)
         """
         # Determine profile from environment or parameter
         self.profile = profile or os.environ.get("APP_ENV", "development")
@@ -33,58 +79,49 @@ class WebAppConfig:
 
         # Initialize resolver
         self.resolver = ProfileConfigResolver(
-            config_name="webapp", profile=self.profile, overrides=overrides
+            config_name="webapp",
+            profile=self.profile,
+            overrides=overrides,
+            start_dir=start_dir,
         )
 
         # Load configuration
         self._config = self.resolver.resolve()
 
+        # Every dot-separated path, so nested lookups are a single dict access
+        self._flat = dict(iter_flat(self._config))
+
     def _add_environment_overrides(self, overrides: Dict[str, Any]) -> None:
         """Add configuration overrides from environment variables."""
-        env_mappings = {
-            "DATABASE_URL": "database.url",
-            "REDIS_URL": "cache.redis_url",
-            "SECRET_KEY": "security.secret_key",
-            "DEBUG": "debug",
-            "PORT": "server.port",
-            "LOG_LEVEL": "logging.level",
-        }
-
-        for env_var, config_key in env_mappings.items():
-            if env_var in os.environ:
-                value = os.environ[env_var]
+        environ_get = os.environ.get
+        for env_var, keys in ENV_MAPPINGS:
+            value = environ_get(env_var)
+            if value is None:
+                continue
 
-                # Convert boolean strings
-                if value.lower() in ("true", "false"):
-                    value = value.lower() == "true"
-                # Convert numeric strings
-                elif value.isdigit():
-                    value = int(value)
+            # Convert boolean strings (only short values can be booleans)
+            if len(value) <= 5 and value.lower() in BOOLEAN_STRINGS:
+                value = BOOLEAN_STRINGS[value.lower()]
+            # Convert numeric strings (with at most one leading minus sign)
+            elif (value[1:] if value.startswith("-") else value).isdecimal():
+                value = int(value)
 
-                # Set nested configuration
-                keys = config_key.split(".")
-                current = overrides
-                for key in keys[:-1]:
-                    current = current.setdefault(key, {})
-                current[keys[-1]] = value
+            set_path(overrides, keys, value)
 
     @property
     def database_url(self) -> str:
         """Get database connection URL."""
-        db_config = self._config.get("database", {})
-        return db_config.get("url", "sqlite:///app.db")
+        return self._flat.get("database.url", "sqlite:///app.db")
 
     @property
     def redis_url(self) -> str:
         """Get Redis connection URL."""
-        cache_config = self._config.get("cache", {})
-        return cache_config.get("redis_url", "redis://localhost:6379/0")
+        return self._flat.get("cache.redis_url", "redis://localhost:6379/0")
 
     @property
     def secret_key(self) -> str:
         """Get application secret key."""
-        security_config = self._config.get("security", {})
-        return security_config.get("secret_key", "dev-secret-key")
+        return self._flat.get("security.secret_key", "dev-secret-key")
 
     @property
     def debug(self) -> bool:
@@ -107,19 +144,11 @@ class WebAppConfig:
 
     def get_nested(self, key_path: str, default: Any = None) -> Any:
         """Get nested configuration value by dot-separated path."""
-        keys = key_path.split(".")
-        current = self._config
-
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
+        return self._flat.get(key_path, default)
 
-        return current
 
-
-def create_webapp_config():
+@contextmanager
+def webapp_config():
     """Create a comprehensive web application configuration."""
     config_content = """
 # Default configuration
@@ -267,25 +296,18 @@ profiles:
       social_login: true
 """
 
-    # Create config directory and file
-    config_dir = Path("webapp")
-    config_dir.mkdir(exist_ok=True)
-    config_file = config_dir / "config.yaml"
-    config_file.write_text(config_content)
-
-    return config_file
+    with temporary_config("webapp", config_content) as tmpdir:
+        yield tmpdir
 
 
 def demonstrate_webapp_config():
     """Demonstrate web application configuration usage."""
     print("=== Web Application Configuration Example ===\n")
 
-    config_file = create_webapp_config()
-
-    try:
+    with webapp_config() as tmpdir:
         # Example 1: Development configuration
         print("1. Development Environment:")
-        dev_config = WebAppConfig(profile="development")
+        dev_config = WebAppConfig(profile="development", start_dir=tmpdir)
 
         print(f"   Debug mode: {dev_config.debug}")
         print(f"   Database URL: {dev_config.database_url}")
@@ -295,7 +317,7 @@ def demonstrate_webapp_config():
 
         # Example 2: Production configuration
         print("2. Production Environment:")
-        prod_config = WebAppConfig(profile="production")
+        prod_config = WebAppConfig(profile="production", start_dir=tmpdir)
 
         print(f"   Debug mode: {prod_config.debug}")
         print(f"   Database URL: {prod_config.database_url}")
@@ -311,7 +333,7 @@ def demonstrate_webapp_config():
         os.environ["DEBUG"] = "true"
         os.environ["PORT"] = "9000"
 
-        override_config = WebAppConfig(profile="production")
+        override_config = WebAppConfig(profile="production", start_dir=tmpdir)
 
         print(f"   Database URL (overridden): {override_config.database_url}")
         print(f"   Debug mode (overridden): {override_config.debug}")
@@ -334,7 +356,7 @@ def demonstrate_webapp_config():
         }
 
         custom_config = WebAppConfig(
-            profile="development", config_overrides=runtime_overrides
+            profile="development", config_overrides=runtime_overrides, start_dir=tmpdir
         )
 
         print(f"   Server host: {custom_config.get_nested('server.host')}")
@@ -343,19 +365,12 @@ def demonstrate_webapp_config():
         print(f"   Custom setting: {custom_config.get('custom_setting')}")
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 def demonstrate_config_validation():
     """Demonstrate configuration validation patterns."""
     print("=== Configuration Validation Example ===\n")
 
-    config_file = create_webapp_config()
-
-    try:
+    with webapp_config() as tmpdir:
 
         def validate_config(config: WebAppConfig) -> None:
             """Validate web application configuration."""
@@ -391,7 +406,7 @@ def demonstrate_config_validation():
 
         # Valid development config
         try:
-            dev_config = WebAppConfig(profile="development")
+            dev_config = WebAppConfig(profile="development", start_dir=tmpdir)
             validate_config(dev_config)
             print("   Development config: VALID")
         except ValueError as e:
@@ -399,7 +414,7 @@ def demonstrate_config_validation():
 
         # Invalid production config (default secret key)
         try:
-            prod_config = WebAppConfig(profile="production")
+            prod_config = WebAppConfig(profile="production", start_dir=tmpdir)
             validate_config(prod_config)
             print("   Production config: VALID")
         except ValueError as e:
@@ -410,6 +425,7 @@ def demonstrate_config_validation():
             prod_config = WebAppConfig(
                 profile="production",
                 config_overrides={"security": {"secret_key": "secure-production-key"}},
+                start_dir=tmpdir,
             )
             validate_config(prod_config)
             print("   Production config (fixed): VALID")
@@ -418,11 +434,6 @@ def demonstrate_config_validation():
 
         print()
 
-    finally:
-        # Cleanup
-        config_file.unlink()
-        config_file.parent.rmdir()
-
 
 if __name__ == "__main__":
     demonstrate_webapp_config()
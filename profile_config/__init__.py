@@ -19,6 +19,7 @@ from .exceptions import (
     ProfileConfigError,
     ProfileNotFoundError,
 )
+from .frozen import FrozenDict, FrozenList
 from .merger import ConfigMerger
 from .profiles import ProfileResolver
 from .resolver import ProfileConfigResolver
@@ -33,6 +34,8 @@ __all__ = [
     "ConfigDiscovery",
     "ProfileResolver",
     "ConfigMerger",
+    "FrozenDict",
+    "FrozenList",
     "ProfileConfigError",
     "ConfigNotFoundError",
     "ProfileNotFoundError",
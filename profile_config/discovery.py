@@ -7,8 +7,9 @@ user's home directory.
 """
 
 import os
+import stat
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set, Union
 
 from .exceptions import ConfigNotFoundError
 
@@ -18,18 +19,28 @@ class ConfigDiscovery:
     Discovers configuration files using hierarchical directory search.
 
     Searches for configuration files in the following order:
-    1. Current working directory and parent directories (up to root)
+    1. Current working directory (or the given start directory) and parent
+       directories (up to root)
     2. User's home directory (if enabled)
 
     For each directory, looks for: {config_name}/{profile_filename}.{extension}
     """
 
+    __slots__ = (
+        "config_name",
+        "profile_filename",
+        "extensions",
+        "search_home",
+        "start_dir",
+    )
+
     def __init__(
         self,
         config_name: str,
         profile_filename: str = "config",
         extensions: List[str] = None,
         search_home: bool = True,
+        start_dir: Optional[Union[str, os.PathLike]] = None,
     ):
         """
         Initialize configuration discovery.
@@ -39,11 +50,14 @@ class ConfigDiscovery:
             profile_filename: Name of the profile file without extension (default: "config")
             extensions: List of file extensions to search for (default: yaml, yml, json, toml)
             search_home: Whether to search in the user's home directory
+            start_dir: Directory to start the upward search from
+                (default: the current working directory at discovery time)
         """
         self.config_name = config_name
         self.profile_filename = profile_filename
         self.extensions = extensions or ["yaml", "yml", "json", "toml"]
         self.search_home = search_home
+        self.start_dir = Path(start_dir).resolve() if start_dir else None
 
     def discover_config_files(self) -> List[Path]:
         """
@@ -79,35 +93,47 @@ class ConfigDiscovery:
     def _search_directory_tree(self) -> List[Path]:
         """Search up directory tree for {config_name}/{profile_filename}.{ext}"""
         config_files = []
-        current = Path.cwd()
+        # Plain strings: no Path is built for directories that hold no config
+        current = os.fspath(self.start_dir or Path.cwd())
+        parent = os.path.dirname(current)
 
-        while current != current.parent:
-            config_dir = current / self.config_name
-            if config_dir.is_dir():
-                config_files.extend(self._search_directory(config_dir))
-            current = current.parent
+        while current != parent:
+            config_files.extend(
+                self._search_directory(os.path.join(current, self.config_name))
+            )
+            current, parent = parent, os.path.dirname(parent)
 
         return config_files
 
     def _search_home_directory(self) -> List[Path]:
         """Search home directory for {config_name}/{profile_filename}.{ext}"""
-        home = Path.home()
-        config_dir = home / self.config_name
-
-        if config_dir.is_dir():
-            return self._search_directory(config_dir)
+        return self._search_directory(os.path.join(Path.home(), self.config_name))
 
-        return []
+    def _search_directory(self, directory: str) -> List[Path]:
+        """
+        Search for config files in a candidate config directory.
 
-    def _search_directory(self, directory: Path) -> List[Path]:
-        """Search for config files in a specific directory."""
+        A single stat tells whether the directory exists. Nothing is cached,
+        so directories and files created since the last call are always found.
+        """
+        try:
+            dir_stat = os.stat(directory)
+        except OSError:
+            return []
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return []
+
+        # Each name is looked up by the filesystem itself, so a
+        # case-insensitive filesystem matches it as before
         config_files = []
-
         for ext in self.extensions:
-            config_file = directory / f"{self.profile_filename}.{ext}"
-            if config_file.is_file():
-                config_files.append(config_file)
-
+            config_file = os.path.join(directory, f"{self.profile_filename}.{ext}")
+            try:
+                file_stat = os.stat(config_file)
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                config_files.append(Path(config_file))
         return config_files
 
     def _remove_duplicates(self, config_files: List[Path]) -> List[Path]:
@@ -128,7 +154,7 @@ class ConfigDiscovery:
         locations = []
 
         # Add directory tree locations
-        current = Path.cwd()
+        current = self.start_dir or Path.cwd()
         while current != current.parent:
             locations.append(str(current / self.config_name))
             current = current.parent
@@ -2,6 +2,8 @@
 Exception classes for profile-config.
 """
 
+from typing import Any, List, Optional, Sequence, Tuple
+
 
 class ProfileConfigError(Exception):
     """Base exception for all profile-config errors."""
@@ -22,9 +24,30 @@ class ProfileNotFoundError(ProfileConfigError):
 
 
 class CircularInheritanceError(ProfileConfigError):
-    """Raised when circular inheritance is detected in profiles."""
-
-    pass
+    """
+    Raised when circular inheritance is detected in profiles.
+
+    Attributes:
+        path: Profile names along the inheritance chain, ending with the
+            profile that closes the cycle (empty if not known)
+    """
+
+    def __init__(self, message: Optional[str] = None, path: Sequence[str] = ()):
+        """
+        Initialize the error.
+
+        Args:
+            message: Error message (default: built from path)
+            path: Profile names along the cycle, in inheritance order
+        """
+        if message is None:
+            message = f"Circular inheritance detected: {' -> '.join(path)}"
+        super().__init__(message)
+        self.path: List[str] = list(path)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Exception pickles only args; keep path too (e.g., for process pools)
+        return (type(self), (self.args[0], self.path))
 
 
 class ConfigFormatError(ProfileConfigError):
@@ -0,0 +1,118 @@
+"""
+Read-only views of resolved configuration data.
+
+Views wrap the (possibly cached and shared) configuration without copying it.
+Nested dictionaries and lists are wrapped lazily as they are accessed, so
+reading a few values costs nothing proportional to the size of the
+configuration.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List
+
+from .merger import _ATOMIC_TYPES, _clone
+
+
+def _view(value: Any) -> Any:
+    """Wrap a configuration value so that it cannot be modified."""
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is dict:
+        return FrozenDict(value)
+    if value_type is list:
+        return FrozenList(value)
+    # Other mutable values (sets, dict subclasses) are rare - copy them
+    return _clone(value)
+
+
+class FrozenDict(Mapping):
+    """
+    Read-only view of a configuration dictionary.
+
+    Compares equal to a dictionary with the same contents. Use copy() to get
+    a mutable (deep) copy.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[Any, Any]):
+        """
+        Initialize the view.
+
+        Args:
+            data: Dictionary to expose; it must not be modified while viewed
+        """
+        self._data = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return _view(self._data[key])
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+        if isinstance(other, dict):
+            return self._data == other
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def copy(self) -> Dict[Any, Any]:
+        """Return a mutable deep copy of the dictionary."""
+        return _clone(self._data)
+
+
+class FrozenList(Sequence):
+    """
+    Read-only view of a configuration list.
+
+    Compares equal to a list with the same contents. Use copy() to get a
+    mutable (deep) copy.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: List[Any]):
+        """
+        Initialize the view.
+
+        Args:
+            data: List to expose; it must not be modified while viewed
+        """
+        self._data = data
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return _view(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenList):
+            return self._data == other._data
+        if isinstance(other, list):
+            return self._data == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def copy(self) -> List[Any]:
+        """Return a mutable deep copy of the list."""
+        return _clone(self._data)
@@ -2,34 +2,225 @@
 Configuration file loading with multiple format support.
 """
 
+import functools
 import json
 import logging
+import marshal
+import os
+import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 
 try:
     import yaml
 
     HAS_YAML = True
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # LibYAML-backed
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 except ImportError:
     HAS_YAML = False
 
 try:
-    import tomllib  # Python 3.11+
+    import rtoml as _toml  # type: ignore[import-not-found]  # Rust-backed
 
     HAS_TOML = True
 except ImportError:
     try:
-        import tomli as tomllib  # type: ignore[no-redef]
+        import tomllib as _toml  # Python 3.11+
 
         HAS_TOML = True
     except ImportError:
-        HAS_TOML = False
+        try:
+            import tomli as _toml  # type: ignore[no-redef]
+
+            HAS_TOML = True
+        except ImportError:
+            HAS_TOML = False
 
 from .exceptions import ConfigFormatError
+from .merger import _clone
 
 logger = logging.getLogger(__name__)
 
+_warned_pure_python_yaml = False
+
+# Suffix of on-disk parse caches, written next to the YAML file
+DISK_CACHE_SUFFIX = ".cache"
+
+# Longest string value that is interned when loading files
+_MAX_INTERNED_LENGTH = 64
+
+# Identifies the interpreter and marshal format that wrote a disk cache
+_DISK_CACHE_TAG = (sys.implementation.cache_tag, marshal.version)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    intern_keys: bool = True,
+    disk_cache: bool = False,
+) -> Dict[str, Any]:
+    """
+    Read and parse a YAML file, memoized on its stat signature.
+
+    The modification time and size are part of the cache key only, so that
+    an edited file produces a new entry instead of a stale hit. Callers must
+    copy the returned dictionary before mutating it.
+    """
+    signature = (_DISK_CACHE_TAG, mtime_ns, size, intern_keys)
+    if disk_cache:
+        data = _read_disk_cache(path, signature)
+        if data is not None:
+            return data
+
+    # A single read of the whole file; the parsers work from the buffer
+    with open(path, "rb") as f:
+        data = _parse_yaml(f.read(), Path(path))
+    if intern_keys:
+        data = _intern_strings(data)
+
+    if disk_cache:
+        _write_disk_cache(path, signature, data)
+    return data
+
+
+@functools.lru_cache(maxsize=128)
+def _load_data_cached(
+    path: str, mtime_ns: int, size: int, intern_keys: bool = True
+) -> Dict[str, Any]:
+    """
+    Read and parse a JSON or TOML file, memoized on its stat signature.
+
+    Same contract as _load_yaml_cached: callers must copy the returned
+    dictionary before mutating it.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    if path.lower().endswith(".json"):
+        data = _parse_json(content, Path(path))
+    else:
+        data = _parse_toml(content, Path(path))
+    return _intern_strings(data) if intern_keys else data
+
+
+def _read_disk_cache(path: str, signature: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """Return the data stored in a disk cache, or None if missing or stale."""
+    try:
+        with open(path + DISK_CACHE_SUFFIX, "rb") as f:
+            cached_signature, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if cached_signature != signature or not isinstance(data, dict):
+        return None
+    logger.debug("Loaded %s from disk cache", path)
+    return data
+
+
+def _write_disk_cache(
+    path: str, signature: Tuple[Any, ...], data: Dict[str, Any]
+) -> None:
+    """
+    Atomically write parsed data next to its source file.
+
+    Failures are logged and otherwise ignored: the cache is an optimization,
+    and data marshal cannot represent (such as dates) is simply not cached.
+    """
+    try:
+        payload = marshal.dumps((signature, data))
+    except ValueError as e:
+        logger.debug("Not caching %s on disk: %s", path, e)
+        return
+
+    directory = os.path.dirname(path)
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, path + DISK_CACHE_SUFFIX)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write disk cache for %s: %s", path, e)
+
+
+def _intern_strings(data: Any) -> Any:
+    """
+    Return a copy of data with string keys and short string values interned.
+
+    Values such as "localhost" or "INFO" recur across profiles and files;
+    interning keeps a single copy of each. Long values (URLs, secrets) rarely
+    repeat and are left alone.
+    """
+    if isinstance(data, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_strings(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_intern_strings(item) for item in data]
+    if type(data) is str and len(data) <= _MAX_INTERNED_LENGTH:
+        return sys.intern(data)
+    return data
+
+
+def _parse_yaml(content: Union[str, bytes], file_path: Path) -> Dict[str, Any]:
+    """Parse YAML content into a dictionary."""
+    global _warned_pure_python_yaml
+    if not _warned_pure_python_yaml and _YamlLoader is yaml.SafeLoader:
+        logger.warning(
+            "LibYAML not available, using the slower pure-Python YAML loader. "
+            "Install PyYAML with LibYAML bindings for faster parsing."
+        )
+        _warned_pure_python_yaml = True
+
+    try:
+        data = yaml.load(content, Loader=_YamlLoader)  # nosec B506 - safe loader
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ConfigFormatError(
+                f"YAML file must contain a dictionary, got {type(data).__name__}: {file_path}"
+            )
+        return data
+    except yaml.YAMLError as e:
+        raise ConfigFormatError(f"Invalid YAML in {file_path}: {e}")
+
+
+def _parse_json(content: Union[str, bytes], file_path: Path) -> Dict[str, Any]:
+    """Parse JSON content into a dictionary."""
+    try:
+        data = json.loads(content)
+        if not isinstance(data, dict):
+            raise ConfigFormatError(
+                f"JSON file must contain an object, got {type(data).__name__}: {file_path}"
+            )
+        return data
+    except json.JSONDecodeError as e:
+        raise ConfigFormatError(f"Invalid JSON in {file_path}: {e}")
+
+
+def _parse_toml(content: Union[str, bytes], file_path: Path) -> Dict[str, Any]:
+    """Parse TOML content into a dictionary."""
+    if not HAS_TOML:
+        raise ConfigFormatError(
+            "TOML support not available. Install tomli: pip install tomli"
+        )
+
+    try:
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return _toml.loads(content)
+    except Exception as e:  # TOML parsers raise various exceptions
+        raise ConfigFormatError(f"Invalid TOML in {file_path}: {e}")
+
 
 class ConfigLoader:
     """
@@ -39,6 +230,24 @@ class ConfigLoader:
     based on file extension.
     """
 
+    __slots__ = ("intern_keys", "enable_disk_cache")
+
+    def __init__(self, intern_keys: bool = True, enable_disk_cache: bool = False):
+        """
+        Initialize configuration loader.
+
+        Args:
+            intern_keys: Whether to intern dictionary keys and short string
+                values of loaded files so that repeated lookups of profile
+                names and config keys can match by identity, and recurring
+                values are stored once (default: True)
+            enable_disk_cache: Whether to keep parsed YAML files in a cache
+                file next to each source (e.g., config.yaml.cache) so that
+                other processes can skip parsing (default: False)
+        """
+        self.intern_keys = intern_keys
+        self.enable_disk_cache = enable_disk_cache
+
     def load_config_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Load configuration from file.
@@ -53,66 +262,100 @@ class ConfigLoader:
             ConfigFormatError: If file format is unsupported or invalid
             FileNotFoundError: If file does not exist
         """
-        if not file_path.exists():
+        # The one stat of the file: existence check and parse cache key
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ConfigFormatError(f"Error reading file {file_path}: {e}")
 
         extension = file_path.suffix.lower()
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                if extension in [".yaml", ".yml"]:
-                    return self._load_yaml(f.read(), file_path)
-                elif extension == ".json":
-                    return self._load_json(f.read(), file_path)
-                elif extension == ".toml":
-                    return self._load_toml(f.read(), file_path)
-                else:
-                    raise ConfigFormatError(
-                        f"Unsupported file format: {extension}. "
-                        f"Supported formats: .yaml, .yml, .json, .toml"
-                    )
-        except (OSError, IOError) as e:
-            raise ConfigFormatError(f"Error reading file {file_path}: {e}")
+        if extension in [".yaml", ".yml"]:
+            return self._load_yaml_file(file_path, stat)
 
-    def _load_yaml(self, content: str, file_path: Path) -> Dict[str, Any]:
-        """Load YAML content."""
-        if not HAS_YAML:
+        if extension not in [".json", ".toml"]:
             raise ConfigFormatError(
-                "YAML support not available. Install PyYAML: pip install pyyaml"
+                f"Unsupported file format: {extension}. "
+                f"Supported formats: .yaml, .yml, .json, .toml"
             )
 
         try:
-            data = yaml.safe_load(content)
-            if data is None:
-                return {}
-            if not isinstance(data, dict):
-                raise ConfigFormatError(
-                    f"YAML file must contain a dictionary, got {type(data).__name__}: {file_path}"
-                )
-            return data
-        except yaml.YAMLError as e:
-            raise ConfigFormatError(f"Invalid YAML in {file_path}: {e}")
+            data = _load_data_cached(
+                os.path.abspath(file_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.intern_keys,
+            )
+        except (OSError, IOError) as e:
+            raise ConfigFormatError(f"Error reading file {file_path}: {e}")
 
-    def _load_json(self, content: str, file_path: Path) -> Dict[str, Any]:
-        """Load JSON content."""
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
+        # The cached dictionary is shared - hand out a private copy
+        return _clone(data)
+
+    def load_config_string(
+        self, content: str, file_format: str = "yaml", source: str = "<string>"
+    ) -> Dict[str, Any]:
+        """
+        Load configuration from a string.
+
+        Args:
+            content: Configuration text
+            file_format: Format of the text: "yaml", "yml", "json" or "toml"
+                (default: "yaml")
+            source: Name used for the content in error messages
+
+        Returns:
+            Dictionary containing configuration data
+
+        Raises:
+            ConfigFormatError: If format is unsupported or content is invalid
+        """
+        file_format = file_format.lower().lstrip(".")
+        source_path = Path(source)
+
+        if file_format in ["yaml", "yml"]:
+            if not HAS_YAML:
                 raise ConfigFormatError(
-                    f"JSON file must contain an object, got {type(data).__name__}: {file_path}"
+                    "YAML support not available. Install PyYAML: pip install pyyaml"
                 )
-            return data
-        except json.JSONDecodeError as e:
-            raise ConfigFormatError(f"Invalid JSON in {file_path}: {e}")
+            data = _parse_yaml(content, source_path)
+        elif file_format == "json":
+            data = _parse_json(content, source_path)
+        elif file_format == "toml":
+            data = _parse_toml(content, source_path)
+        else:
+            raise ConfigFormatError(
+                f"Unsupported format: {file_format}. "
+                f"Supported formats: yaml, yml, json, toml"
+            )
+
+        return _intern_strings(data) if self.intern_keys else data
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all memoized file contents."""
+        _load_yaml_cached.cache_clear()
+        _load_data_cached.cache_clear()
 
-    def _load_toml(self, content: str, file_path: Path) -> Dict[str, Any]:
-        """Load TOML content."""
-        if not HAS_TOML:
+    def _load_yaml_file(self, file_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """Load a YAML file through the parse cache, given its stat result."""
+        if not HAS_YAML:
             raise ConfigFormatError(
-                "TOML support not available. Install tomli: pip install tomli"
+                "YAML support not available. Install PyYAML: pip install pyyaml"
             )
 
         try:
-            return tomllib.loads(content)
-        except Exception as e:  # tomllib raises various exceptions
-            raise ConfigFormatError(f"Invalid TOML in {file_path}: {e}")
+            data = _load_yaml_cached(
+                os.path.abspath(file_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.intern_keys,
+                self.enable_disk_cache,
+            )
+        except (OSError, IOError) as e:
+            raise ConfigFormatError(f"Error reading file {file_path}: {e}")
+
+        # The cached dictionary is shared - hand out a private copy
+        return _clone(data)
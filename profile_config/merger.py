@@ -2,29 +2,387 @@
 Configuration merging with precedence handling.
 """
 
+import copy
 import logging
 import os
-from typing import Any, Dict, List
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Sequence, Set, Tuple
 
-from omegaconf import DictConfig, OmegaConf
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
 
 logger = logging.getLogger(__name__)
 
+# Plain ${path.to.key} references, the only interpolation syntax resolved natively.
+# Anything else (resolvers such as ${env:VAR}, relative ${.key}, escapes) is
+# handed to OmegaConf.
+_VAR_RE = re.compile(r"\$\{([\w\-]+(?:\.[\w\-]+)*)\}")
+
+
+class _UnsupportedInterpolation(Exception):
+    """Raised when a value needs OmegaConf to be interpolated."""
+
+
+class _InterpolationCycle(_UnsupportedInterpolation):
+    """Raised when interpolated values reference each other in a cycle."""
+
+
+class _MergeGroup(list):
+    """Dictionaries from successive sources that merge under a single key."""
+
+
+# OmegaConf's mandatory-missing marker: never overrides a value when merging
+_MISSING = "???"
+
+# Immutable types that can be shared between copies
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _clone(value: Any) -> Any:
+    """
+    Deep copy parsed configuration data.
+
+    Plain dictionaries and lists are rebuilt directly and immutable scalars are
+    shared, which avoids the memo bookkeeping and per-object dispatch of
+    copy.deepcopy. Anything else (dates, sets, dict subclasses) falls back to
+    copy.deepcopy.
+    """
+    atomic_types = _ATOMIC_TYPES
+    value_type = type(value)
+    if value_type is dict:
+        # Scalars are checked inline to avoid a call per leaf
+        return {
+            key: item if type(item) in atomic_types else _clone(item)
+            for key, item in value.items()
+        }
+    if value_type is list:
+        return [item if type(item) in atomic_types else _clone(item) for item in value]
+    if value_type in atomic_types:
+        return value
+    return copy.deepcopy(value)
+
+
+def _merge_all(sources: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Deep merge several dictionaries in a single pass.
+
+    Later sources take precedence. Nested dictionaries are merged key by key;
+    any other value (including lists) replaces what came before, and a
+    dictionary replaces a non-dictionary value. As with OmegaConf, the
+    missing-value marker '???' does not replace an earlier value. Each level
+    is merged across all sources at once, so every output dictionary is built
+    exactly once and overridden values are never copied. Uses an explicit work stack instead of
+    recursion, and copies the surviving values so that the result never
+    shares mutable state with the sources.
+
+    Args:
+        sources: Dictionaries to merge, lowest precedence first
+
+    Returns:
+        New merged dictionary
+    """
+    result: Dict[str, Any] = {}
+    stack: List[Tuple[Dict[str, Any], Sequence[Dict[str, Any]]]] = [(result, sources)]
+    atomic_types = _ATOMIC_TYPES
+    merge_group = _MergeGroup
+    push = stack.append
+    while stack:
+        target, group = stack.pop()
+
+        # Last value per key, or the dicts to merge since the last non-dict
+        pending: Dict[Any, Any] = {}
+        for source in group:
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    current = pending.get(key)
+                    if type(current) is merge_group:
+                        current.append(value)
+                    else:
+                        pending[key] = merge_group((value,))
+                elif value != _MISSING or key not in pending:
+                    pending[key] = value
+
+        for key, value in pending.items():
+            value_type = type(value)
+            if value_type in atomic_types:
+                # Immutable leaves are shared without a call into _clone
+                target[key] = value
+            elif value_type is not merge_group:
+                target[key] = _clone(value)
+            elif len(value) == 1:
+                target[key] = _clone(value[0])
+            else:
+                child: Dict[str, Any] = {}
+                target[key] = child
+                push((child, value))
+    return result
+
+
+def _lookup(root: Dict[str, Any], path: str) -> Any:
+    """Look up a dot-separated path from the configuration root."""
+    node: Any = root
+    for part in path.split("."):
+        if isinstance(node, dict) and part in node:
+            node = node[part]
+        elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+            node = node[int(part)]
+        else:
+            raise _UnsupportedInterpolation(path)
+    if node == _MISSING:
+        raise _UnsupportedInterpolation(path)
+    return node
+
+
+def _locate(root: Dict[str, Any], path: str) -> Tuple[Tuple[Any, ...], Any]:
+    """
+    Find the location a dot-separated reference points to.
+
+    Returns:
+        Tuple of the key path and the (unresolved) value found there
+
+    Raises:
+        _UnsupportedInterpolation: If the path does not exist or runs through
+            a value that is itself an interpolation
+    """
+    node: Any = root
+    keys: List[Any] = []
+    for part in path.split("."):
+        if isinstance(node, dict) and part in node:
+            keys.append(part)
+            node = node[part]
+        elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+            keys.append(int(part))
+            node = node[int(part)]
+        else:
+            raise _UnsupportedInterpolation(path)
+    return tuple(keys), node
+
+
+def _collect_markers(
+    data: Any, path: Tuple[Any, ...], markers: Dict[Tuple[Any, ...], str]
+) -> None:
+    """Record the key path of every string containing an interpolation marker."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            _collect_markers(value, path + (key,), markers)
+    elif isinstance(data, list):
+        for index, item in enumerate(data):
+            _collect_markers(item, path + (index,), markers)
+    elif isinstance(data, str) and "${" in data:
+        markers[path] = data
+
+
+def _split_template(value: str) -> List[str]:
+    """
+    Split a string into alternating literal text and ${path} references.
+
+    A single regex pass yields the parts used both to find the references a
+    value depends on and to substitute them later: even indexes are literal
+    text, odd indexes are reference paths.
+
+    Raises:
+        _UnsupportedInterpolation: If the string uses syntax other than plain
+            ${path} references
+    """
+    if "\\${" in value:
+        raise _UnsupportedInterpolation(value)
+    parts = _VAR_RE.split(value)
+    for literal in parts[0::2]:
+        if "${" in literal:
+            raise _UnsupportedInterpolation(value)
+    return parts
+
+
+def _dependencies(
+    root: Dict[str, Any], parts: List[str], markers: Dict[Tuple[Any, ...], str]
+) -> Set[Tuple[Any, ...]]:
+    """
+    Find the interpolated values a split string depends on.
+
+    A reference to an interpolated value depends on it directly; a reference
+    to a dictionary or list depends on every interpolated value inside it.
+
+    Raises:
+        _UnsupportedInterpolation: If a reference points to a missing key
+    """
+    deps: Set[Tuple[Any, ...]] = set()
+    for reference in parts[1::2]:
+        keys, target = _locate(root, reference)
+        if keys in markers:
+            deps.add(keys)
+        elif isinstance(target, (dict, list)):
+            depth = len(keys)
+            deps.update(path for path in markers if path[:depth] == keys)
+    return deps
+
+
+def _resolution_order(
+    deps: Dict[Tuple[Any, ...], Set[Tuple[Any, ...]]],
+) -> List[Tuple[Any, ...]]:
+    """
+    Order interpolated values so that each comes after everything it references.
+
+    Uses Kahn's algorithm over the reference graph.
+
+    Raises:
+        _InterpolationCycle: If values reference each other in a cycle
+    """
+    pending = {path: len(required) for path, required in deps.items()}
+    dependents: Dict[Tuple[Any, ...], List[Tuple[Any, ...]]] = {}
+    for path, required in deps.items():
+        for dep in required:
+            dependents.setdefault(dep, []).append(path)
+
+    queue: Deque[Tuple[Any, ...]] = deque(
+        path for path, count in pending.items() if count == 0
+    )
+    order: List[Tuple[Any, ...]] = []
+    while queue:
+        path = queue.popleft()
+        order.append(path)
+        for dependent in dependents.get(path, ()):
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) < len(deps):
+        unresolved = ", ".join(
+            ".".join(str(key) for key in path)
+            for path, count in pending.items()
+            if count
+        )
+        raise _InterpolationCycle(f"circular reference involving: {unresolved}")
+    return order
+
+
+def _substitute(parts: List[str], root: Dict[str, Any]) -> Any:
+    """
+    Substitute ${path} references whose targets are already resolved.
+
+    A string consisting of a single reference takes the referenced value
+    with its type; otherwise references are substituted as text.
+    """
+    if len(parts) == 3 and not parts[0] and not parts[2]:
+        return _clone(_lookup(root, parts[1]))
+
+    pieces = parts[:]
+    for index in range(1, len(pieces), 2):
+        value = _lookup(root, pieces[index])
+        if isinstance(value, (dict, list)):
+            raise _UnsupportedInterpolation(pieces[index])
+        pieces[index] = str(value)
+    return "".join(pieces)
+
+
+def _has_interpolation(data: Any) -> bool:
+    """Check whether any string in the configuration contains a ${ marker."""
+    if isinstance(data, dict):
+        return any(_has_interpolation(value) for value in data.values())
+    if isinstance(data, list):
+        return any(_has_interpolation(item) for item in data)
+    return isinstance(data, str) and "${" in data
+
+
+def _interpolate(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve plain ${path} references throughout a configuration.
+
+    Builds the graph of which values reference which, then substitutes
+    values in topological order so that each is resolved exactly once.
+
+    Args:
+        config: Configuration with unresolved interpolation strings
+
+    Returns:
+        New configuration with references resolved
+
+    Raises:
+        _UnsupportedInterpolation: If any value needs OmegaConf to resolve
+        _InterpolationCycle: If values reference each other in a cycle
+    """
+    # The reference graph is built from the input, so that configurations
+    # needing OmegaConf are rejected before anything is copied
+    markers: Dict[Tuple[Any, ...], str] = {}
+    _collect_markers(config, (), markers)
+
+    templates = {path: _split_template(value) for path, value in markers.items()}
+    deps = {
+        path: _dependencies(config, parts, markers) for path, parts in templates.items()
+    }
+    order = _resolution_order(deps)
+
+    result = _clone(config)
+    for path in order:
+        parent: Any = result
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = _substitute(templates[path], result)
+
+    return result
+
+
+def _resolve_leaves(
+    omega_config: "DictConfig", config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Resolve the interpolated values of a configuration through OmegaConf.
+
+    Only the strings containing markers are resolved, one at a time, so a
+    value that fails to resolve is left as it is without giving up on the
+    rest or converting the whole tree a second time.
+
+    Args:
+        omega_config: OmegaConf view of the configuration
+        config: The same configuration as plain data
+
+    Returns:
+        New configuration with every resolvable interpolation resolved
+    """
+    from omegaconf import DictConfig, ListConfig, OmegaConf
+
+    result = _clone(config)
+
+    markers: Dict[Tuple[Any, ...], str] = {}
+    _collect_markers(result, (), markers)
+
+    failures = []
+    for path in markers:
+        parent: Any = result
+        node: Any = omega_config
+        for key in path[:-1]:
+            parent = parent[key]
+            node = node[key]
+        try:
+            value = node[path[-1]]
+            if isinstance(value, (DictConfig, ListConfig)):
+                value = OmegaConf.to_container(value, resolve=True)
+        except Exception as e:
+            failures.append(f"{'.'.join(str(key) for key in path)} ({e})")
+            continue
+        parent[path[-1]] = value
+
+    if failures:
+        logger.warning("Variable interpolation failed: %s", "; ".join(failures))
+    return result
+
 
 class ConfigMerger:
     """
     Merges configuration from multiple sources with precedence rules.
 
-    Uses OmegaConf for robust merging and variable interpolation.
     Supports deep merging of nested dictionaries and variable substitution.
+    Merging and plain ${path} interpolation are native; OmegaConf handles
+    resolvers such as ${env:VAR} and other advanced interpolation syntax.
     """
 
-    def __init__(self):
-        """Initialize the config merger and register custom resolvers."""
-        self._register_resolvers()
+    __slots__ = ()
 
-    def _register_resolvers(self):
+    @staticmethod
+    def _register_resolvers():
         """Register custom OmegaConf resolvers for environment variable access."""
+        from omegaconf import OmegaConf
+
         # Register 'env' resolver for ${env:VAR_NAME} syntax
         # Returns None if variable doesn't exist (will be converted to empty string)
         if not OmegaConf.has_resolver("env"):
@@ -56,17 +414,33 @@ class ConfigMerger:
             return {}
 
         if len(valid_configs) == 1:
-            config = OmegaConf.create(valid_configs[0])
-            return self._to_dict(config, enable_interpolation)
+            # Nothing to merge; a copy keeps the caller's data untouched
+            merged = _clone(valid_configs[0])
+        else:
+            merged = _merge_all(valid_configs)
+        logger.debug("Merged %d configuration sources", len(valid_configs))
 
-        # Convert all configs to OmegaConf objects
-        omega_configs = [OmegaConf.create(config) for config in valid_configs]
+        if not enable_interpolation:
+            return merged
+        return self.interpolate(merged)
 
-        # Merge all configurations
-        merged = OmegaConf.merge(*omega_configs)  # type: ignore[arg-type]
+    def interpolate(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve variable interpolations in a configuration without merging it.
 
-        logger.debug(f"Merged {len(valid_configs)} configuration sources")
-        return self._to_dict(merged, enable_interpolation)  # type: ignore[arg-type]
+        Unlike merge_configs(), the configuration is not copied when it has
+        nothing to interpolate, so pass a dictionary that is not shared.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            config itself if it contains no interpolation markers or cannot
+            be interpolated, otherwise a new dictionary with them resolved
+        """
+        if not _has_interpolation(config):
+            return config
+        return self._interpolate(config)
 
     def merge_config_files(
         self, config_data_list: List[Dict[str, Any]], enable_interpolation: bool = True
@@ -85,27 +459,36 @@ class ConfigMerger:
             *config_data_list, enable_interpolation=enable_interpolation
         )
 
-    def _to_dict(
-        self, omega_config: DictConfig, enable_interpolation: bool
-    ) -> Dict[str, Any]:
+    def _interpolate(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Convert OmegaConf object to regular dictionary.
+        Resolve variable interpolations in a merged configuration.
+
+        Plain ${path} references are resolved natively; OmegaConf is only
+        used for anything else, such as the ${env:VAR} resolver.
 
         Args:
-            omega_config: OmegaConf configuration object
-            enable_interpolation: Whether to resolve interpolations
+            config: Merged configuration containing interpolation markers
 
         Returns:
-            Regular Python dictionary
+            Configuration with interpolations resolved; values that cannot be
+            resolved are left as they are
         """
-        if enable_interpolation:
-            # Resolve interpolations and convert to dict
-            try:
-                return OmegaConf.to_container(omega_config, resolve=True)  # type: ignore[return-value]
-            except Exception as e:
-                logger.warning(f"Variable interpolation failed: {e}")
-                # Fall back to unresolved config
-                return OmegaConf.to_container(omega_config, resolve=False)  # type: ignore[return-value]
-        else:
-            # Return without resolving interpolations
-            return OmegaConf.to_container(omega_config, resolve=False)  # type: ignore[return-value]
+        try:
+            return _interpolate(config)
+        except _InterpolationCycle as e:
+            logger.warning("Variable interpolation failed: %s", e)
+            return config
+        except _UnsupportedInterpolation:
+            pass
+
+        # OmegaConf is slow to import, so it is only loaded when needed
+        from omegaconf import OmegaConf
+
+        self._register_resolvers()
+        try:
+            omega_config = OmegaConf.create(config)
+        except Exception as e:
+            logger.warning("Variable interpolation failed: %s", e)
+            return config
+
+        return _resolve_leaves(omega_config, config)
@@ -3,13 +3,17 @@ Profile resolution with inheritance support.
 """
 
 import logging
-from typing import Any, Dict, List, Set
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, NoReturn, Optional, Tuple
 
 from .exceptions import CircularInheritanceError, ProfileNotFoundError
-from .merger import ConfigMerger
+from .merger import ConfigMerger, _clone
 
 logger = logging.getLogger(__name__)
 
+# Top-level keys with a meaning of their own, never copied into a profile
+_RESERVED_KEYS = frozenset({"profiles", "defaults", "default_profile"})
+
 
 class ProfileResolver:
     """
@@ -19,6 +23,8 @@ class ProfileResolver:
     Profiles can inherit from other profiles, creating a chain of configuration merging.
     """
 
+    __slots__ = ("inherit_key", "merger", "_chain_links", "_chains")
+
     def __init__(self, inherit_key: str = "inherits"):
         """
         Initialize profile resolver.
@@ -29,6 +35,10 @@ class ProfileResolver:
         self.inherit_key = inherit_key
         self.merger = ConfigMerger()
 
+        # Inheritance chains for the most recently seen parent links
+        self._chain_links: Optional[Tuple[Tuple[str, Optional[str]], ...]] = None
+        self._chains: Dict[str, Tuple[str, ...]] = {}
+
     def resolve_profile(
         self,
         config_data: Dict[str, Any],
@@ -44,26 +54,76 @@ class ProfileResolver:
             default_profile: Name of default profile to use as base
 
         Returns:
-            Resolved configuration dictionary
+            Resolved configuration dictionary, sharing no data with config_data
 
         Notes:
             If profile "default" is requested but doesn't exist, an empty profile
             is automatically created, returning only the defaults section.
 
+            Inheritance chains are computed once and reused for as long as
+            the profile names and their parents stay the same, including
+            across reloads of the same configuration files.
+
         Raises:
             ProfileNotFoundError: If requested profile is not found
             CircularInheritanceError: If circular inheritance is detected
         """
+        return self._resolve_profile(config_data, profile_name, default_profile, None)
+
+    def resolve_profiles(
+        self,
+        config_data: Dict[str, Any],
+        profile_names: Iterable[str],
+        default_profile: str = "default",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve several profiles of the same configuration.
+
+        Equivalent to calling resolve_profile() for each name, but ancestors
+        shared by several profiles (e.g., many profiles inheriting from "base")
+        are merged only once.
+
+        Args:
+            config_data: Full configuration data containing profiles
+            profile_names: Names of profiles to resolve
+            default_profile: Name of default profile to use as base
+
+        Returns:
+            Mapping of profile name to resolved configuration dictionary
+
+        Raises:
+            ProfileNotFoundError: If a requested profile is not found
+            CircularInheritanceError: If circular inheritance is detected
+        """
+        # Merged inheritance chains, keyed by profile name, for this call only
+        merged_chains: Dict[str, Dict[str, Any]] = {}
+        return {
+            name: self._resolve_profile(
+                config_data, name, default_profile, merged_chains
+            )
+            for name in profile_names
+        }
+
+    def _resolve_profile(
+        self,
+        config_data: Dict[str, Any],
+        profile_name: str,
+        default_profile: str,
+        merged_chains: Optional[Dict[str, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Resolve a profile, reusing merged_chains when given (see resolve_profiles)."""
         profiles = config_data.get("profiles", {})
         defaults = config_data.get("defaults", {})
 
         # If no profiles section, return defaults with any top-level config
         if not profiles:
-            result = defaults.copy()
+            result = self.merger.merge_configs(defaults, enable_interpolation=False)
             # Add any non-reserved keys from root level
-            for key, value in config_data.items():
-                if key not in ["profiles", "defaults", "default_profile"]:
-                    result[key] = value
+            result.update(
+                (key, _clone(value))
+                for key, value in config_data.items()
+                if key not in _RESERVED_KEYS
+            )
             return result
 
         # Check if requested profile exists
@@ -74,12 +134,12 @@ class ProfileResolver:
                 logger.debug(
                     "Profile 'default' not found, using empty profile (defaults only)"
                 )
-                return defaults.copy()
+                return self.merger.merge_configs(defaults, enable_interpolation=False)
 
             # Try default profile if different from requested
             if profile_name != default_profile and default_profile in profiles:
                 logger.warning(
-                    f"Profile '{profile_name}' not found, using '{default_profile}'"
+                    "Profile '%s' not found, using '%s'", profile_name, default_profile
                 )
                 profile_name = default_profile
             else:
@@ -88,71 +148,188 @@ class ProfileResolver:
                     f"Available profiles: {list(profiles.keys())}"
                 )
 
-        # Resolve inheritance chain
-        resolved_config = self._resolve_inheritance_chain(profiles, profile_name, set())
-
         # Merge with defaults using deep merge (defaults have lowest precedence)
         # FIX: Use merger.merge_configs() for deep merge instead of shallow .update()
+        profile = profiles[profile_name]
+        if isinstance(profile, dict) and self.inherit_key not in profile:
+            # No inheritance: the chains of the other profiles are not needed
+            sources = [defaults, profile]
+        elif merged_chains is None:
+            # Defaults and the whole inheritance chain in a single merge, so
+            # only the final dictionary is built
+            sources = [defaults, *self._chain_settings(profiles, profile_name)]
+        else:
+            sources = [
+                defaults,
+                self._resolve_inheritance_chain(profiles, profile_name, merged_chains),
+            ]
         final_config = self.merger.merge_configs(
-            defaults,
-            resolved_config,
+            *sources,
             enable_interpolation=False,  # Interpolation happens later in resolver
         )
 
-        logger.debug(f"Resolved profile '{profile_name}' with {len(final_config)} keys")
+        logger.debug(
+            "Resolved profile '%s' with %d keys", profile_name, len(final_config)
+        )
         return final_config
 
     def _resolve_inheritance_chain(
-        self, profiles: Dict[str, Any], profile_name: str, visited: Set[str]
+        self,
+        profiles: Dict[str, Any],
+        profile_name: str,
+        merged_chains: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
-        Recursively resolve inheritance chain for a profile.
+        Resolve inheritance chain for a profile.
 
         Args:
             profiles: Dictionary of all profiles
-            profile_name: Current profile to resolve
-            visited: Set of already visited profiles (for cycle detection)
+            profile_name: Profile to resolve
+            merged_chains: Already merged chains by profile name; when given,
+                the chains of the profile and its ancestors are read from and
+                added to it, so that shared ancestors are merged once
 
         Returns:
-            Resolved configuration for the profile
+            Resolved configuration for the profile (shared with merged_chains
+            when given, so it must not be modified)
 
         Raises:
             CircularInheritanceError: If circular inheritance is detected
+            ProfileNotFoundError: If a parent profile does not exist
         """
-        if profile_name in visited:
-            cycle_path = " -> ".join(visited) + f" -> {profile_name}"
-            raise CircularInheritanceError(
-                f"Circular inheritance detected: {cycle_path}"
+        if merged_chains is None:
+            return self.merger.merge_configs(
+                *self._chain_settings(profiles, profile_name),
+                enable_interpolation=False,  # Interpolation happens later
             )
 
-        if profile_name not in profiles:
-            raise ProfileNotFoundError(
-                f"Profile '{profile_name}' not found in inheritance chain"
+        chain = self._get_chain(profiles, profile_name)
+
+        # Start from the nearest ancestor that is already merged, then merge
+        # each descendant onto its parent, remembering every step
+        depth = next(
+            (index for index, name in enumerate(chain) if name in merged_chains),
+            len(chain),
+        )
+        for index in range(depth - 1, -1, -1):
+            name = chain[index]
+            parent = [merged_chains[chain[index + 1]]] if index + 1 < len(chain) else []
+            merged_chains[name] = self.merger.merge_configs(
+                *parent,
+                self._own_settings(profiles[name]),
+                enable_interpolation=False,
             )
+        return merged_chains[profile_name]
 
-        visited.add(profile_name)
-        profile_config = profiles[profile_name].copy()
+    def _chain_settings(
+        self, profiles: Dict[str, Any], profile_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the settings of a profile and its ancestors, root ancestor first.
 
-        # Check for inheritance
-        parent_profile = profile_config.pop(self.inherit_key, None)
+        Raises:
+            CircularInheritanceError: If circular inheritance is detected
+            ProfileNotFoundError: If a parent profile does not exist
+        """
+        chain = self._get_chain(profiles, profile_name)
+        return [self._own_settings(profiles[name]) for name in reversed(chain)]
 
-        if parent_profile:
-            # Recursively resolve parent configuration
-            parent_config = self._resolve_inheritance_chain(
-                profiles, parent_profile, visited.copy()
-            )
+    def _get_chain(
+        self, profiles: Dict[str, Any], profile_name: str
+    ) -> Tuple[str, ...]:
+        """
+        Get the inheritance chain of a profile (profile first, root ancestor last).
 
-            # Merge parent config with current profile using deep merge
-            # FIX: Use merger.merge_configs() for deep merge
-            merged_config = self.merger.merge_configs(
-                parent_config,
-                profile_config,
-                enable_interpolation=False,  # Interpolation happens later
+        Raises:
+            CircularInheritanceError: If circular inheritance is detected
+            ProfileNotFoundError: If a parent profile does not exist
+        """
+        chain = self._get_chains(profiles).get(profile_name)
+        if chain is None:
+            self._raise_chain_error(profiles, profile_name)
+        return chain
+
+    def _own_settings(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a profile's settings without its inheritance key."""
+        if self.inherit_key not in profile:
+            return profile  # Merging copies it; no need to filter first
+        return {key: value for key, value in profile.items() if key != self.inherit_key}
+
+    def _get_chains(self, profiles: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+        """Get inheritance chains for profiles, recomputing them only when links change."""
+        links = tuple(
+            (
+                name,
+                profile.get(self.inherit_key) if isinstance(profile, dict) else None,
             )
-            profile_config = merged_config
+            for name, profile in profiles.items()
+        )
+        if links != self._chain_links:
+            self._chains = self._build_chains(links)
+            self._chain_links = links
+        return self._chains
+
+    @staticmethod
+    def _build_chains(
+        links: Tuple[Tuple[str, Optional[str]], ...],
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Compute the inheritance chain of every profile in one pass.
+
+        Uses Kahn's algorithm on the parent -> child graph: profiles without a
+        parent are processed first, and each child is processed after its
+        parent, so its chain is its own name followed by the parent's chain.
+        Profiles that are never reached inherit, directly or indirectly, from
+        a missing profile or from a cycle; they are left out of the result.
+
+        Args:
+            links: (profile name, parent name or None) pairs for all profiles
+
+        Returns:
+            Mapping of profile name to chain (profile first, root ancestor last)
+        """
+        parents: Dict[str, str] = {}
+        children: Dict[str, List[str]] = {}
+        queue: Deque[str] = deque()
+
+        for name, parent in links:
+            if parent:
+                parents[name] = parent
+                children.setdefault(parent, []).append(name)
+            else:
+                queue.append(name)
+
+        chains: Dict[str, Tuple[str, ...]] = {}
+        while queue:
+            name = queue.popleft()
+            parent = parents.get(name)
+            chains[name] = (name,) + chains[parent] if parent else (name,)
+            queue.extend(children.get(name, ()))
+
+        return chains
+
+    def _raise_chain_error(
+        self, profiles: Dict[str, Any], profile_name: str
+    ) -> NoReturn:
+        """
+        Raise the error explaining why a profile has no inheritance chain.
+
+        Raises:
+            CircularInheritanceError: If the chain runs into a cycle
+            ProfileNotFoundError: If the chain references a missing profile
+        """
+        # Insertion-ordered, so the walk is both the path and the visited set
+        path: Dict[str, None] = {}
+        current = profile_name
+        while current not in path:
+            if current not in profiles:
+                raise ProfileNotFoundError(
+                    f"Profile '{current}' not found in inheritance chain"
+                )
+            path[current] = None
+            current = profiles[current].get(self.inherit_key)
 
-        visited.remove(profile_name)
-        return profile_config
+        raise CircularInheritanceError(path=[*path, current])
 
     def list_profiles(self, config_data: Dict[str, Any]) -> List[str]:
         """
@@ -6,13 +6,17 @@ import logging
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 from .discovery import ConfigDiscovery
 from .exceptions import ConfigFormatError, ConfigNotFoundError
+from .frozen import FrozenDict
 from .loader import ConfigLoader
-from .merger import ConfigMerger
+from .merger import ConfigMerger, _clone
 from .profiles import ProfileResolver
 
 logger = logging.getLogger(__name__)
@@ -21,6 +25,42 @@ logger = logging.getLogger(__name__)
 OverrideSource = Union[Dict[str, Any], str, Path, os.PathLike]
 OverridesType = Optional[Union[OverrideSource, List[OverrideSource]]]
 
+# Values that depend on the process state rather than on file contents:
+# $(command) substitutions and ${resolver:...} interpolations such as ${env:VAR},
+# with the whitespace and resolver names (e.g., ${ my-res:x}) OmegaConf accepts
+_DYNAMIC_PATTERN = re.compile(r"\$\(|\$\{\s*[\w\-.]+\s*:")
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert configuration data into a hashable form for use as a cache key.
+
+    Raises:
+        TypeError: If the data contains values that cannot be hashed
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def _is_static(data: Any) -> bool:
+    """Check that configuration data contains no command or resolver references."""
+    if isinstance(data, dict):
+        return all(_is_static(value) for value in data.values())
+    if isinstance(data, list):
+        return all(_is_static(item) for item in data)
+    if isinstance(data, str):
+        return _DYNAMIC_PATTERN.search(data) is None
+    return True
+
+
+def _resolve_in_worker(resolver: "ProfileConfigResolver") -> Dict[str, Any]:
+    """Resolve a configuration in a worker, leaving environment variables unapplied."""
+    return resolver.resolve_many([resolver.profile])[resolver.profile]
+
 
 class ProfileConfigResolver:
     """
@@ -31,6 +71,33 @@ class ProfileConfigResolver:
     with proper precedence handling.
     """
 
+    __slots__ = (
+        "config_name",
+        "profile",
+        "profile_filename",
+        "enable_interpolation",
+        "apply_environment",
+        "environment_key",
+        "override_environment",
+        "command_timeout",
+        "cache_size",
+        "_config_data",
+        "_env_applied",
+        "_env_skipped",
+        "discovery",
+        "loader",
+        "profile_resolver",
+        "merger",
+        "override_list",
+    )
+
+    # Resolved configurations (before environment application), shared by
+    # all resolvers and LRU ordered
+    _resolved_cache: "ClassVar[OrderedDict[Tuple[Any, ...], Dict[str, Any]]]" = (
+        OrderedDict()
+    )
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         config_name: str,
@@ -45,6 +112,10 @@ class ProfileConfigResolver:
         environment_key: str = "env_vars",
         override_environment: bool = False,
         command_timeout: float = 2.0,
+        cache_size: int = 64,
+        intern_keys: bool = True,
+        enable_disk_cache: bool = False,
+        start_dir: Optional[Union[str, os.PathLike]] = None,
     ):
         """
         Initialize profile configuration resolver.
@@ -65,6 +136,16 @@ class ProfileConfigResolver:
             environment_key: Key name for environment variables section (default: "env_vars")
             override_environment: Whether to override existing environment variables (default: False)
             command_timeout: Timeout in seconds for command execution (default: 2.0)
+            cache_size: Maximum number of resolved configurations kept in the
+                cache shared by all resolvers when this resolver adds one;
+                0 disables caching for this resolver (default: 64)
+            intern_keys: Whether to intern keys and short string values of loaded
+                configuration files; disable for files with very large sets of
+                unique keys (default: True)
+            enable_disk_cache: Whether to cache parsed YAML files on disk next to
+                each source, for processes that start often (default: False)
+            start_dir: Directory to start searching for configuration files from,
+                instead of the current working directory (default: None)
         """
         self.config_name = config_name
         self.profile = profile
@@ -74,6 +155,10 @@ class ProfileConfigResolver:
         self.environment_key = environment_key
         self.override_environment = override_environment
         self.command_timeout = command_timeout
+        self.cache_size = cache_size
+
+        # In-memory configuration used instead of discovered files
+        self._config_data: Optional[Dict[str, Any]] = None
 
         # Track environment variable application
         self._env_applied: Dict[str, str] = {}
@@ -85,14 +170,80 @@ class ProfileConfigResolver:
             profile_filename=profile_filename,
             extensions=extensions,
             search_home=search_home,
+            start_dir=start_dir,
+        )
+        self.loader = ConfigLoader(
+            intern_keys=intern_keys, enable_disk_cache=enable_disk_cache
         )
-        self.loader = ConfigLoader()
         self.profile_resolver = ProfileResolver(inherit_key=inherit_key)
         self.merger = ConfigMerger()
 
         # Process overrides into list of dictionaries
         self.override_list = self._process_overrides(overrides)
 
+    @classmethod
+    def from_mapping(
+        cls,
+        config_data: Dict[str, Any],
+        config_name: str = "<memory>",
+        **kwargs: Any,
+    ) -> "ProfileConfigResolver":
+        """
+        Create a resolver for an in-memory configuration.
+
+        The configuration takes the place of discovered configuration files;
+        no file system search is performed. Results are not memoized, since
+        the mapping may be changed between calls.
+
+        Args:
+            config_data: Configuration data, structured like a config file
+            config_name: Name of the configuration, used in log messages
+            **kwargs: Other arguments accepted by ProfileConfigResolver
+
+        Returns:
+            Resolver for the given configuration
+
+        Raises:
+            ConfigFormatError: If config_data is not a dictionary
+        """
+        if not isinstance(config_data, dict):
+            raise ConfigFormatError(
+                f"Configuration must be a dictionary, got {type(config_data).__name__}"
+            )
+
+        resolver = cls(config_name, **kwargs)
+        resolver._config_data = config_data
+        return resolver
+
+    @classmethod
+    def from_string(
+        cls,
+        content: str,
+        config_name: str = "<memory>",
+        file_format: str = "yaml",
+        **kwargs: Any,
+    ) -> "ProfileConfigResolver":
+        """
+        Create a resolver for configuration text.
+
+        Args:
+            content: Configuration text, structured like a config file
+            config_name: Name of the configuration, used in log and error messages
+            file_format: Format of the text: "yaml", "json" or "toml" (default: "yaml")
+            **kwargs: Other arguments accepted by ProfileConfigResolver
+
+        Returns:
+            Resolver for the given configuration
+
+        Raises:
+            ConfigFormatError: If the content cannot be parsed
+        """
+        resolver = cls(config_name, **kwargs)
+        resolver._config_data = resolver.loader.load_config_string(
+            content, file_format, source=config_name
+        )
+        return resolver
+
     def _process_overrides(self, overrides: OverridesType) -> List[Dict[str, Any]]:
         """
         Process overrides into a list of dictionaries.
@@ -115,35 +266,47 @@ class ProfileConfigResolver:
         else:
             override_list = overrides
 
-        # Process each override source
-        processed: List[Dict[str, Any]] = []
-        for override_source in override_list:
-            if isinstance(override_source, dict):
-                # Direct dictionary
-                processed.append(override_source)
-                logger.debug("Added dictionary override")
-            elif isinstance(override_source, (str, Path, os.PathLike)):
-                # File path - load it
-                file_path = Path(override_source)
-                try:
-                    override_dict = self.loader.load_config_file(file_path)
-                    processed.append(override_dict)
-                    logger.debug(f"Loaded override from {file_path}")
-                except FileNotFoundError:
-                    raise ConfigFormatError(f"Override file not found: {file_path}")
-                except Exception as e:
-                    raise ConfigFormatError(
-                        f"Failed to load override file {file_path}: {e}"
-                    )
-            else:
-                raise ConfigFormatError(
-                    f"Invalid override type: {type(override_source).__name__}. "
-                    f"Expected dict, file path, or list of dicts/paths"
-                )
+        # Each source maps to exactly one dictionary, in order
+        processed = [self._process_override(source) for source in override_list]
 
-        logger.debug(f"Processed {len(processed)} override sources")
+        logger.debug("Processed %d override sources", len(processed))
         return processed
 
+    def _process_override(self, override_source: OverrideSource) -> Dict[str, Any]:
+        """
+        Turn a single override source into a dictionary.
+
+        Args:
+            override_source: Override dictionary or path to an override file
+
+        Returns:
+            Override dictionary
+
+        Raises:
+            ConfigFormatError: If file cannot be loaded or invalid type provided
+        """
+        if isinstance(override_source, dict):
+            # Direct dictionary
+            logger.debug("Added dictionary override")
+            return override_source
+
+        if not isinstance(override_source, (str, os.PathLike)):
+            raise ConfigFormatError(
+                f"Invalid override type: {type(override_source).__name__}. "
+                f"Expected dict, file path, or list of dicts/paths"
+            )
+
+        # File path - load it
+        file_path = Path(override_source)
+        try:
+            override_dict = self.loader.load_config_file(file_path)
+        except FileNotFoundError:
+            raise ConfigFormatError(f"Override file not found: {file_path}")
+        except Exception as e:
+            raise ConfigFormatError(f"Failed to load override file {file_path}: {e}")
+        logger.debug("Loaded override from %s", file_path)
+        return override_dict
+
     def _expand_value(self, value: Any, context: str = "") -> Any:
         """
         Expand command substitutions in a single value.
@@ -171,11 +334,10 @@ class ProfileConfigResolver:
 
         # Process each command substitution
         expanded_value = value
+        where = f" for {context}" if context else ""
         for cmd in matches:
             try:
-                logger.debug(
-                    f"Executing command{' for ' + context if context else ''}: {cmd}"
-                )
+                logger.debug("Executing command%s: %s", where, cmd)
 
                 # Execute command with shell expansion and current environment
                 proc_result = subprocess.run(
@@ -190,35 +352,32 @@ class ProfileConfigResolver:
                 if proc_result.returncode != 0:
                     stderr = proc_result.stderr.strip()
                     logger.error(
-                        f"Command failed{' for ' + context if context else ''}: {cmd} "
-                        f"(exit {proc_result.returncode}): {stderr}"
+                        "Command failed%s: %s (exit %d): %s",
+                        where,
+                        cmd,
+                        proc_result.returncode,
+                        stderr,
                     )
                     # Failed command = return None
                     return None
 
                 output = proc_result.stdout.strip()
                 if not output:
-                    logger.warning(
-                        f"Command produced no output{' for ' + context if context else ''}: {cmd}"
-                    )
+                    logger.warning("Command produced no output%s: %s", where, cmd)
                     # Empty output = return None
                     return None
 
                 # Replace this command substitution with its output
                 expanded_value = expanded_value.replace(f"$({cmd})", output)
-                logger.debug(
-                    f"Command output{' for ' + context if context else ''}: {output}"
-                )
+                logger.debug("Command output%s: %s", where, output)
 
             except subprocess.TimeoutExpired:
                 logger.error(
-                    f"Command timeout ({self.command_timeout}s){' for ' + context if context else ''}: {cmd}"
+                    "Command timeout (%ss)%s: %s", self.command_timeout, where, cmd
                 )
                 return None
             except Exception as e:
-                logger.error(
-                    f"Command execution error{' for ' + context if context else ''}: {cmd} - {e}"
-                )
+                logger.error("Command execution error%s: %s - %s", where, cmd, e)
                 return None
 
         return expanded_value
@@ -243,7 +402,9 @@ class ProfileConfigResolver:
                 if expanded is not None:
                     result[key] = expanded
                 else:
-                    logger.debug(f"Skipping key '{current_path}' due to failed command")
+                    logger.debug(
+                        "Skipping key '%s' due to failed command", current_path
+                    )
             return result
         elif isinstance(data, list):
             result_list: List[Any] = []
@@ -286,7 +447,9 @@ class ProfileConfigResolver:
 
         if not isinstance(env_vars, dict):
             logger.warning(
-                f"'{self.environment_key}' section must be a dictionary, found {type(env_vars).__name__}"
+                "'%s' section must be a dictionary, found %s",
+                self.environment_key,
+                type(env_vars).__name__,
             )
             return config_copy
 
@@ -294,13 +457,13 @@ class ProfileConfigResolver:
         for key, value in env_vars.items():
             if not isinstance(key, str):
                 logger.warning(
-                    f"Environment variable key must be string, skipping: {key}"
+                    "Environment variable key must be string, skipping: %s", key
                 )
                 continue
 
             # None value means "not set" (from failed command or missing env var)
             if value is None:
-                logger.debug(f"Skipping environment variable '{key}' (value is None)")
+                logger.debug("Skipping environment variable '%s' (value is None)", key)
                 continue
 
             # Convert value to string
@@ -310,13 +473,16 @@ class ProfileConfigResolver:
             if key in os.environ and not self.override_environment:
                 self._env_skipped[key] = str_value
                 logger.debug(
-                    f"Environment variable '{key}' already exists, skipping "
-                    f"(override_environment=False)"
+                    "Environment variable '%s' already exists, skipping "
+                    "(override_environment=False)",
+                    key,
                 )
             else:
-                os.environ[key] = str_value
                 self._env_applied[key] = str_value
-                logger.debug(f"Set environment variable '{key}' from config")
+                logger.debug("Set environment variable '%s' from config", key)
+
+        # Apply everything at once after validation has finished
+        os.environ.update(self._env_applied)
 
         applied_count = len(self._env_applied)
         skipped_count = len(self._env_skipped)
@@ -324,8 +490,10 @@ class ProfileConfigResolver:
 
         if applied_count > 0 or skipped_count > 0:
             logger.info(
-                f"Processed {total_count} environment variables: "
-                f"{applied_count} applied, {skipped_count} skipped"
+                "Processed %d environment variables: %d applied, %d skipped",
+                total_count,
+                applied_count,
+                skipped_count,
             )
 
         return config_copy
@@ -342,7 +510,7 @@ class ProfileConfigResolver:
             "skipped": dict(self._env_skipped),
         }
 
-    def resolve(self) -> Dict[str, Any]:
+    def resolve(self, profile: Optional[str] = None) -> Dict[str, Any]:
         """
         Resolve configuration with full precedence handling.
 
@@ -352,9 +520,18 @@ class ProfileConfigResolver:
         3. Expand command substitutions in entire config
         4. Resolve profile with inheritance
         5. Apply overrides in order (highest precedence)
-        6. Apply variable interpolation (OmegaConf)
+        6. Apply variable interpolation (native, OmegaConf for resolvers)
         7. Apply environment variables from config (if enabled)
 
+        Steps 2-6 are memoized process-wide: repeat calls with unchanged
+        configuration files and settings reuse the previous result, even from
+        a different resolver instance. Configurations that use
+        $(command) substitution or resolvers such as ${env:VAR} are never cached.
+
+        Args:
+            profile: Profile to resolve instead of the resolver's own profile,
+                so one resolver can serve several profiles (default: None)
+
         Returns:
             Resolved configuration dictionary (without env_vars section)
 
@@ -364,20 +541,279 @@ class ProfileConfigResolver:
             CircularInheritanceError: If circular inheritance is detected
             ConfigFormatError: If override files cannot be loaded
         """
+        final_config, shared = self._resolve_shared(profile)
+        return _clone(final_config) if shared else final_config
+
+    def resolve_frozen(self, profile: Optional[str] = None) -> FrozenDict:
+        """
+        Resolve configuration and return it as a read-only view.
+
+        Resolves exactly like resolve(), but the result is not copied out of
+        the cache: nested sections are wrapped in read-only views as they are
+        accessed. Use this for configurations that are only read; call
+        copy() on the result (or on any section) to get a mutable copy.
+
+        Args:
+            profile: Profile to resolve instead of the resolver's own profile
+                (default: None)
+
+        Returns:
+            Read-only mapping of the resolved configuration (without env_vars section)
+
+        Raises:
+            ConfigNotFoundError: If no configuration files are found
+            ProfileNotFoundError: If requested profile is not found
+            CircularInheritanceError: If circular inheritance is detected
+            ConfigFormatError: If override files cannot be loaded
+        """
+        final_config, _ = self._resolve_shared(profile)
+        return FrozenDict(final_config)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Resolve configuration and return a single value.
+
+        Resolves exactly like resolve(), including applying environment
+        variables, but when the configuration comes from the cache only the
+        requested value is copied instead of the whole configuration.
+
+        Args:
+            key: Key of the value, using dots for nested keys (e.g., "database.host")
+            default: Value returned if the key does not exist (default: None)
+
+        Returns:
+            Configuration value, or default if not found
+
+        Raises:
+            ConfigNotFoundError: If no configuration files are found
+            ProfileNotFoundError: If requested profile is not found
+            CircularInheritanceError: If circular inheritance is detected
+        """
+        value: Any
+        value, shared = self._resolve_shared()
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return default
+            value = value[part]
+        return _clone(value) if shared else value
+
+    def _resolve_shared(
+        self, profile: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Run the resolution steps, reusing cached results where possible.
+
+        Args:
+            profile: Profile to resolve (default: the resolver's profile)
+
+        Returns:
+            Tuple of the resolved configuration and whether its values are
+            shared with the cache, in which case they must be copied before
+            being handed to callers
+        """
+        if profile is None:
+            profile = self.profile
+
         # Step 1: Discover configuration files
+        config_files = self._discover_config_files()
+
+        # Steps 2-6 are skipped when the same inputs were resolved before
+        cache_key = self._make_cache_key(config_files, profile)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            final_config, shared = cached, True
+            logger.debug("Using cached configuration for profile '%s'", profile)
+        else:
+            final_config, cacheable = self._build_config(config_files, profile)
+            shared = cache_key is not None and cacheable
+            if cache_key and shared:
+                self._store_cached(cache_key, final_config)
+
+        # Step 7: Apply environment variables and remove from config
+        # (returns a new top-level dictionary, leaving the cached one intact)
+        final_config = self._apply_environment_variables(final_config)
+
+        logger.info(
+            "Resolved configuration for profile '%s' with %d keys",
+            profile,
+            len(final_config),
+        )
+        return final_config, shared
+
+    def resolve_many(self, profiles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve several profiles from the same configuration files.
+
+        Files are discovered, loaded, merged and command-expanded once for all
+        profiles; only profile inheritance, overrides and interpolation run per
+        profile. Each result equals what resolve() returns for that profile,
+        except that environment variables are not applied: the env_vars
+        section is left in each result instead.
+
+        Args:
+            profiles: Names of profiles to resolve
+
+        Returns:
+            Mapping of profile name to resolved configuration
+
+        Raises:
+            ConfigNotFoundError: If no configuration files are found
+            ProfileNotFoundError: If a requested profile is not found
+            CircularInheritanceError: If circular inheritance is detected
+        """
+        config_files = self._discover_config_files()
+
+        results: Dict[str, Dict[str, Any]] = {}
+        missing: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        for profile in profiles:
+            cache_key = self._make_cache_key(config_files, profile)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                results[profile] = _clone(cached)
+            else:
+                missing[profile] = cache_key
+                results[profile] = {}  # Placeholder keeping the requested order
+
+        if missing:
+            merged_config, overrides, cacheable = self._load_merged_config(config_files)
+            # Inheritance is resolved for all profiles together, so shared
+            # ancestors are merged once
+            profile_configs = self.profile_resolver.resolve_profiles(
+                merged_config,
+                missing,
+                self.profile_resolver.get_default_profile(merged_config),
+            )
+            for profile, cache_key in missing.items():
+                config = self._apply_overrides(profile_configs[profile], overrides)
+                if cache_key and cacheable:
+                    self._store_cached(cache_key, config)
+                    config = _clone(config)
+                results[profile] = config
+
+        logger.info("Resolved %d profiles", len(results))
+        return results
+
+    @staticmethod
+    def resolve_parallel(
+        resolvers: Iterable["ProfileConfigResolver"],
+        max_workers: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve several independent configurations concurrently.
+
+        Intended for batch tooling that loads many application configurations
+        at once, not for request paths. Each resolver is resolved in a worker;
+        environment variables from the results are then applied in this
+        process, in the order the resolvers were given. Worker processes do
+        not share this process's caches.
+
+        Args:
+            resolvers: Resolvers to run, typically for different applications
+            max_workers: Maximum number of workers (default: executor default)
+            use_processes: Whether to use a process pool instead of threads.
+                By default processes are used once there are at least as many
+                resolvers as CPUs; below that, pool start-up costs more than
+                parsing in parallel saves.
+
+        Returns:
+            Resolved configurations, in the same order as resolvers
+
+        Raises:
+            ConfigNotFoundError: If no configuration files are found
+            ProfileNotFoundError: If a requested profile is not found
+            CircularInheritanceError: If circular inheritance is detected
+        """
+        resolvers = list(resolvers)
+        if not resolvers:
+            return []
+
+        if use_processes is None:
+            use_processes = len(resolvers) >= (os.cpu_count() or 1)
+
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        with executor:
+            configs = list(executor.map(_resolve_in_worker, resolvers))
+
+        logger.info("Resolved %d configurations in parallel", len(configs))
+        return [
+            resolver._apply_environment_variables(config)
+            for resolver, config in zip(resolvers, configs)
+        ]
+
+    def _discover_config_files(self) -> List[Path]:
+        """Discover configuration files (none for in-memory configurations)."""
+        if self._config_data is not None:
+            logger.info("Using in-memory configuration '%s'", self.config_name)
+            return []
+
         config_files = self.discovery.discover_config_files()
-        logger.info(f"Found {len(config_files)} configuration files")
+        logger.info("Found %d configuration files", len(config_files))
+        return config_files
 
-        # Step 2: Load configuration files
+    def _load_config_files(self, config_files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Load configuration files, skipping (and logging) files that fail to load.
+
+        Args:
+            config_files: Configuration files to load
+
+        Returns:
+            Loaded configurations, in the same order as config_files
+        """
         config_data_list: List[Dict[str, Any]] = []
-        for config_file in reversed(config_files):  # Reverse for precedence order
+        for config_file in config_files:
             try:
                 config_data = self.loader.load_config_file(config_file)
-                config_data_list.append(config_data)
-                logger.debug(f"Loaded config from {config_file}")
             except Exception as e:
-                logger.warning(f"Failed to load config from {config_file}: {e}")
+                logger.warning("Failed to load config from %s: %s", config_file, e)
                 continue
+            config_data_list.append(config_data)
+            logger.debug("Loaded config from %s", config_file)
+        return config_data_list
+
+    def _build_config(
+        self, config_files: List[Path], profile: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Load, merge and resolve configuration files for a profile.
+
+        Args:
+            config_files: Discovered configuration files (most specific first)
+            profile: Profile to resolve
+
+        Returns:
+            Tuple of the resolved configuration (before environment variables
+            are applied) and whether it is safe to cache - that is, it does
+            not depend on command output or resolver lookups
+        """
+        merged_config, overrides, cacheable = self._load_merged_config(config_files)
+        final_config = self._build_profile_config(merged_config, overrides, profile)
+        return final_config, cacheable
+
+    def _load_merged_config(
+        self, config_files: List[Path]
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], bool]:
+        """
+        Load and merge configuration files and expand command substitutions.
+
+        Args:
+            config_files: Discovered configuration files (most specific first)
+
+        Returns:
+            Tuple of the merged configuration, the expanded overrides and
+            whether results built from them are safe to cache
+        """
+        # Step 2: Load configuration files
+        config_data_list: List[Dict[str, Any]] = []
+        if self._config_data is not None:
+            config_data_list.append(_clone(self._config_data))
+        # Reverse for precedence order
+        config_data_list.extend(self._load_config_files(list(reversed(config_files))))
 
         if not config_data_list:
             raise ConfigNotFoundError("No valid configuration files could be loaded")
@@ -388,44 +824,134 @@ class ProfileConfigResolver:
             enable_interpolation=False,  # Defer interpolation until after profile resolution
         )
 
+        # Command output and resolver lookups can change between calls,
+        # so configurations using them are never cached
+        cacheable = _is_static(merged_config) and all(
+            _is_static(override) for override in self.override_list
+        )
+
         # Step 4: Expand command substitutions BEFORE profile resolution
         # This allows $(command) to work in any configuration value
         logger.debug("Expanding command substitutions in configuration")
         merged_config = self._expand_commands_recursive(merged_config)
 
+        # Expand commands in overrides too
+        expanded_overrides = [
+            self._expand_commands_recursive(override) for override in self.override_list
+        ]
+
+        return merged_config, expanded_overrides, cacheable
+
+    def _build_profile_config(
+        self,
+        merged_config: Dict[str, Any],
+        overrides: List[Dict[str, Any]],
+        profile: str,
+    ) -> Dict[str, Any]:
+        """
+        Resolve a profile from merged configuration and apply overrides.
+
+        Args:
+            merged_config: Merged, command-expanded configuration
+            overrides: Command-expanded overrides in application order
+            profile: Name of profile to resolve
+
+        Returns:
+            Resolved configuration (before environment variables are applied)
+        """
         # Step 5: Resolve profile
         profile_config = self.profile_resolver.resolve_profile(
             merged_config,
-            self.profile,
+            profile,
             self.profile_resolver.get_default_profile(merged_config),
         )
+        return self._apply_overrides(profile_config, overrides)
+
+    def _apply_overrides(
+        self, profile_config: Dict[str, Any], overrides: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Apply overrides to a resolved profile and interpolate variables.
+
+        Args:
+            profile_config: Resolved profile configuration
+            overrides: Command-expanded overrides in application order
 
+        Returns:
+            New configuration (before environment variables are applied)
+        """
         # Step 6: Apply overrides in order and final interpolation
-        if self.override_list:
-            # Expand commands in overrides too
-            expanded_overrides = [
-                self._expand_commands_recursive(override)
-                for override in self.override_list
-            ]
+        if overrides:
             # Apply each override in order (later overrides take precedence)
             final_config = self.merger.merge_configs(
                 profile_config,
-                *expanded_overrides,  # Unpack list to apply in order
+                *overrides,  # Unpack list to apply in order
                 enable_interpolation=self.enable_interpolation,
             )
-            logger.debug(f"Applied {len(self.override_list)} override sources")
+            logger.debug("Applied %d override sources", len(overrides))
+        elif self.enable_interpolation:
+            # The resolved profile is a private copy already: nothing to merge
+            final_config = self.merger.interpolate(profile_config)
         else:
-            final_config = self.merger.merge_configs(
-                profile_config, enable_interpolation=self.enable_interpolation
-            )
+            final_config = profile_config
 
-        # Step 7: Apply environment variables and remove from config
-        final_config = self._apply_environment_variables(final_config)
+        return final_config
 
-        logger.info(
-            f"Resolved configuration for profile '{self.profile}' with {len(final_config)} keys"
+    def _make_cache_key(
+        self, config_files: List[Path], profile: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the resolution cache key for a profile of the discovered files.
+
+        Returns:
+            Cache key, or None if caching is disabled or the inputs cannot be keyed
+        """
+        if self.cache_size <= 0 or self._config_data is not None:
+            return None
+
+        try:
+            file_signature = []
+            for config_file in config_files:
+                stat = os.stat(config_file)
+                file_signature.append(
+                    (str(config_file), stat.st_mtime_ns, stat.st_size)
+                )
+            overrides = tuple(_freeze(override) for override in self.override_list)
+        except (OSError, TypeError):
+            return None
+
+        return (
+            tuple(file_signature),
+            profile,
+            self.profile_resolver.inherit_key,
+            self.enable_interpolation,
+            overrides,
         )
-        return final_config
+
+    def _get_cached(
+        self, cache_key: Optional[Tuple[Any, ...]]
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a resolved configuration, marking it as recently used."""
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            cached = self._resolved_cache.get(cache_key)
+            if cached is not None:
+                self._resolved_cache.move_to_end(cache_key)
+        return cached
+
+    def _store_cached(self, cache_key: Tuple[Any, ...], config: Dict[str, Any]) -> None:
+        """
+        Store a resolved configuration, evicting the least recently used entry.
+
+        The cache takes ownership of config; callers must copy it before
+        handing it out.
+        """
+        with self._cache_lock:
+            self._resolved_cache[cache_key] = config
+            self._resolved_cache.move_to_end(cache_key)
+            while len(self._resolved_cache) > self.cache_size:
+                self._resolved_cache.popitem(last=False)
 
     def list_profiles(self) -> List[str]:
         """
@@ -434,28 +960,26 @@ class ProfileConfigResolver:
         Returns:
             List of available profile names
         """
+        if self._config_data is not None:
+            return self.profile_resolver.list_profiles(self._config_data)
+
         try:
             config_files = self.discovery.discover_config_files()
         except ConfigNotFoundError:
             return []
 
-        # Load and merge all config files to get complete profile list
-        config_data_list: List[Dict[str, Any]] = []
-        for config_file in config_files:
-            try:
-                config_data = self.loader.load_config_file(config_file)
-                config_data_list.append(config_data)
-            except Exception as e:
-                logger.warning(f"Failed to load config from {config_file}: {e}")
-                continue
-
-        if not config_data_list:
-            return []
+        # Collect profile names from every file; merging the whole files is
+        # not needed, only the order in which names first appear
+        profile_names: Dict[str, None] = {}
+        for config_data in self._load_config_files(config_files):
+            profiles = config_data.get("profiles")
+            if isinstance(profiles, dict):
+                profile_names.update(dict.fromkeys(profiles))
+            elif "profiles" in config_data:
+                # A non-mapping value replaces the profiles of earlier files
+                profile_names = {}
 
-        merged_config = self.merger.merge_config_files(
-            config_data_list, enable_interpolation=False
-        )
-        return self.profile_resolver.list_profiles(merged_config)
+        return list(profile_names)
 
     def get_config_files(self) -> List[Path]:
         """
@@ -463,8 +987,28 @@ class ProfileConfigResolver:
 
         Returns:
             List of configuration file paths in precedence order
+            (empty for in-memory configurations)
         """
+        if self._config_data is not None:
+            return []
+
         try:
             return self.discovery.discover_config_files()
         except ConfigNotFoundError:
             return []
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear cached configuration file contents and resolved configurations.
+
+        Both are cached process-wide and invalidated automatically when a
+        file's modification time or size changes. Call this during iterative
+        development if edits might not change either.
+
+        File discovery keeps no cache: every resolve looks for the
+        configuration files again.
+        """
+        ConfigLoader.clear_cache()
+        with ProfileConfigResolver._cache_lock:
+            ProfileConfigResolver._resolved_cache.clear()
@@ -0,0 +1,400 @@
+"""
+Tests for configuration caching.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+import profile_config.loader
+from profile_config import ProfileConfigResolver
+from profile_config.loader import ConfigLoader, _load_data_cached, _load_yaml_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty caches."""
+    ProfileConfigResolver.clear_cache()
+    yield
+    ProfileConfigResolver.clear_cache()
+
+
+class TestFileCache:
+    """Test memoization of parsed configuration files."""
+
+    def test_yaml_parsed_once(self, tmp_path):
+        """Test that loading an unchanged file reuses the parsed result."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("defaults:\n  key: value\n")
+
+        loader = ConfigLoader()
+        first = loader.load_config_file(config_file)
+        second = loader.load_config_file(config_file)
+
+        assert first == second == {"defaults": {"key": "value"}}
+        info = _load_yaml_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cached_data_not_shared(self, tmp_path):
+        """Test that mutating a loaded config does not affect later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("defaults:\n  nested:\n    key: value\n")
+
+        loader = ConfigLoader()
+        first = loader.load_config_file(config_file)
+        first["defaults"]["nested"]["key"] = "mutated"
+
+        second = loader.load_config_file(config_file)
+        assert second["defaults"]["nested"]["key"] == "value"
+
+    def test_modified_file_reloaded(self, tmp_path):
+        """Test that a changed file is parsed again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: old\n")
+
+        loader = ConfigLoader()
+        assert loader.load_config_file(config_file) == {"key": "old"}
+
+        config_file.write_text("key: updated\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert loader.load_config_file(config_file) == {"key": "updated"}
+
+    @pytest.mark.parametrize(
+        "filename, content",
+        [
+            ("config.json", '{"defaults": {"nested": {"key": "value"}}}'),
+            ("config.toml", '[defaults.nested]\nkey = "value"\n'),
+        ],
+    )
+    def test_json_and_toml_parsed_once(self, tmp_path, filename, content):
+        """Test that JSON and TOML files are memoized like YAML files."""
+        config_file = tmp_path / filename
+        config_file.write_text(content)
+
+        loader = ConfigLoader()
+        first = loader.load_config_file(config_file)
+        first["defaults"]["nested"]["key"] = "mutated"
+        second = loader.load_config_file(config_file)
+
+        assert second == {"defaults": {"nested": {"key": "value"}}}
+        info = _load_data_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cache_hit_stats_file_once(self, tmp_path, monkeypatch):
+        """Test that loading an unchanged file costs a single stat."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+        loader = ConfigLoader()
+        loader.load_config_file(config_file)
+
+        stats = []
+        real_stat = os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            stats.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", counting_stat)
+        assert loader.load_config_file(config_file) == {"key": "value"}
+        assert stats == [config_file]
+
+        with pytest.raises(FileNotFoundError):
+            loader.load_config_file(tmp_path / "missing.yaml")
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache discards parsed files."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+
+        ConfigLoader().load_config_file(config_file)
+        assert _load_yaml_cached.cache_info().currsize == 1
+
+        ProfileConfigResolver.clear_cache()
+        assert _load_yaml_cached.cache_info().currsize == 0
+
+
+class TestResolvedCache:
+    """Test memoization of resolved configurations."""
+
+    CONFIG = """
+defaults:
+  timeout: 30
+  database:
+    host: localhost
+
+profiles:
+  dev:
+    database:
+      name: dev_db
+"""
+
+    def test_repeat_resolve_uses_cache(self, tmp_path, monkeypatch):
+        """Test that resolving unchanged inputs again skips the merge."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        first = resolver.resolve()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("configuration was rebuilt")
+
+        monkeypatch.setattr(ProfileConfigResolver, "_build_config", fail)
+        second = resolver.resolve()
+
+        assert first == second
+        assert second["database"] == {"host": "localhost", "name": "dev_db"}
+
+    def test_cache_shared_between_resolvers(self, tmp_path, monkeypatch):
+        """Test that a new resolver with the same settings reuses the result."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        first = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        expected = first.resolve()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("configuration was rebuilt")
+
+        monkeypatch.setattr(ProfileConfigResolver, "_build_config", fail)
+        second = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+
+        assert second.resolve() == expected
+
+        ProfileConfigResolver.clear_cache()
+        with pytest.raises(AssertionError):
+            second.resolve()
+
+    def test_cached_result_not_shared(self, tmp_path, monkeypatch):
+        """Test that mutating a result does not corrupt later resolves."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        resolver.resolve()["database"]["host"] = "mutated"
+
+        assert resolver.resolve()["database"]["host"] == "localhost"
+
+    def test_cache_invalidated_on_file_change(self, tmp_path, monkeypatch):
+        """Test that editing a config file produces a fresh result."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        config_file = tmp_path / "myapp" / "config.yaml"
+        config_file.write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        assert resolver.resolve()["timeout"] == 30
+
+        config_file.write_text(self.CONFIG.replace("30", "300"))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert resolver.resolve()["timeout"] == 300
+
+    def test_cache_size_limit(self, tmp_path, monkeypatch):
+        """Test that the least recently used entries are evicted."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        config_file = tmp_path / "myapp" / "config.yaml"
+
+        resolver = ProfileConfigResolver(
+            "myapp", profile="dev", search_home=False, cache_size=2
+        )
+        for timeout in range(3):
+            config_file.write_text(self.CONFIG.replace("30", str(timeout)))
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + timeout))
+            resolver.resolve()
+
+        assert len(resolver._resolved_cache) == 2
+
+    def test_commands_not_cached(self, tmp_path, monkeypatch):
+        """Test that configurations using command substitution are not cached."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(
+            'defaults:\n  value: "$(echo hello)"\n'
+        )
+
+        resolver = ProfileConfigResolver("myapp", search_home=False)
+        assert resolver.resolve() == {"value": "hello"}
+        assert len(resolver._resolved_cache) == 0
+
+    @pytest.mark.parametrize("value", ["${ env:HOME}", "${my-res:x}"])
+    def test_resolver_interpolations_not_cached(self, tmp_path, monkeypatch, value):
+        """Test that resolver calls OmegaConf accepts in any spelling are not cached."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(
+            f'defaults:\n  value: "{value}"\n'
+        )
+
+        resolver = ProfileConfigResolver("myapp", search_home=False)
+        resolver.resolve()
+        assert len(resolver._resolved_cache) == 0
+
+    def test_cache_disabled(self, tmp_path, monkeypatch):
+        """Test that cache_size=0 disables result caching."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver(
+            "myapp", profile="dev", search_home=False, cache_size=0
+        )
+        resolver.resolve()
+        assert len(resolver._resolved_cache) == 0
+
+
+class TestKeyInterning:
+    """Test interning of loaded configuration keys."""
+
+    def test_keys_interned(self, tmp_path):
+        """Test that keys from different files share one string object."""
+        first_file = tmp_path / "first.yaml"
+        second_file = tmp_path / "second.json"
+        first_file.write_text("database:\n  host: a\n")
+        second_file.write_text('{"database": {"host": "b"}}')
+
+        loader = ConfigLoader()
+        first_key = next(iter(loader.load_config_file(first_file)))
+        second_key = next(iter(loader.load_config_file(second_file)))
+
+        assert first_key is second_key
+
+    def test_short_values_interned(self, tmp_path):
+        """Test that short string values are shared and long ones are not."""
+        long_value = "x" * 65
+        first_file = tmp_path / "first.yaml"
+        second_file = tmp_path / "second.toml"
+        first_file.write_text(f"host: localhost\nsecret: {long_value}\n")
+        second_file.write_text(f'host = "localhost"\nsecret = "{long_value}"\n')
+
+        loader = ConfigLoader()
+        first = loader.load_config_file(first_file)
+        second = loader.load_config_file(second_file)
+
+        assert first["host"] is second["host"]
+        assert first["secret"] == second["secret"]
+        assert first["secret"] is not second["secret"]
+
+    def test_interning_disabled(self, tmp_path):
+        """Test that intern_keys=False loads the same data."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("defaults:\n  items: [{name: a}]\n")
+
+        interned = ConfigLoader().load_config_file(config_file)
+        plain = ConfigLoader(intern_keys=False).load_config_file(config_file)
+
+        assert interned == plain == {"defaults": {"items": [{"name": "a"}]}}
+
+
+class TestGet:
+    """Test reading single values from the resolved configuration."""
+
+    CONFIG = """
+defaults:
+  database:
+    host: localhost
+    options:
+      timeout: 30
+
+profiles:
+  dev:
+    database:
+      name: dev_db
+"""
+
+    def test_get_nested_value(self, tmp_path, monkeypatch):
+        """Test dotted keys, missing keys and defaults."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+
+        assert resolver.get("database.host") == "localhost"
+        assert resolver.get("database.options") == {"timeout": 30}
+        assert resolver.get("database.missing") is None
+        assert resolver.get("database.host.port", 5432) == 5432
+
+    def test_get_result_not_shared(self, tmp_path, monkeypatch):
+        """Test that mutating a value from get does not corrupt the cache."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        resolver.resolve()
+        resolver.get("database.options")["timeout"] = 0
+
+        assert resolver.get("database.options.timeout") == 30
+        assert resolver.resolve()["database"]["options"] == {"timeout": 30}
+
+
+class TestDiskCache:
+    """Test the optional on-disk parse cache."""
+
+    def test_disk_cache_written_and_used(self, tmp_path, monkeypatch):
+        """Test that a fresh process can load the cache instead of parsing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("defaults:\n  key: value\n")
+
+        loader = ConfigLoader(enable_disk_cache=True)
+        assert loader.load_config_file(config_file) == {"defaults": {"key": "value"}}
+        assert (tmp_path / "config.yaml.cache").exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed again")
+
+        ProfileConfigResolver.clear_cache()
+        monkeypatch.setattr(profile_config.loader, "_parse_yaml", fail)
+        data = loader.load_config_file(config_file)
+
+        assert data == {"defaults": {"key": "value"}}
+        assert next(iter(data)) is sys.intern("defaults")
+
+    def test_stale_disk_cache_ignored(self, tmp_path):
+        """Test that editing the file bypasses an outdated cache."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: old\n")
+
+        loader = ConfigLoader(enable_disk_cache=True)
+        loader.load_config_file(config_file)
+
+        config_file.write_text("key: updated\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        ProfileConfigResolver.clear_cache()
+
+        assert loader.load_config_file(config_file) == {"key": "updated"}
+
+    def test_unsupported_values_not_cached(self, tmp_path):
+        """Test that data marshal cannot store is loaded but not cached."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("released: 2024-01-01\n")
+
+        loader = ConfigLoader(enable_disk_cache=True)
+
+        assert loader.load_config_file(config_file) == {
+            "released": datetime.date(2024, 1, 1)
+        }
+        assert not (tmp_path / "config.yaml.cache").exists()
+
+    def test_disk_cache_disabled_by_default(self, tmp_path):
+        """Test that no cache file is written unless enabled."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+
+        ConfigLoader().load_config_file(config_file)
+
+        assert list(tmp_path.iterdir()) == [config_file]
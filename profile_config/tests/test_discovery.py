@@ -1,7 +1,6 @@
 """Tests for configuration file discovery."""
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -91,7 +90,7 @@ class TestConfigDiscovery:
         finally:
             os.chdir(original_cwd)
 
-    def test_home_directory_search(self, tmp_path):
+    def test_home_directory_search(self, tmp_path, tmp_path_factory, monkeypatch):
         """Test searching in home directory."""
         # Create config in mock home directory
         home_config = tmp_path / "myapp"
@@ -102,20 +101,15 @@ class TestConfigDiscovery:
         # Mock home directory
         with patch("pathlib.Path.home", return_value=tmp_path):
             # Create separate work directory that's not under tmp_path
-            with tempfile.TemporaryDirectory() as work_dir:
-                original_cwd = Path.cwd()
-                try:
-                    os.chdir(work_dir)
+            monkeypatch.chdir(tmp_path_factory.mktemp("work"))
 
-                    discovery = ConfigDiscovery("myapp", search_home=True)
-                    files = discovery.discover_config_files()
+            discovery = ConfigDiscovery("myapp", search_home=True)
+            files = discovery.discover_config_files()
 
-                    assert len(files) == 1
-                    assert "location: home" in files[0].read_text()
-                finally:
-                    os.chdir(original_cwd)
+            assert len(files) == 1
+            assert "location: home" in files[0].read_text()
 
-    def test_no_home_directory_search(self, tmp_path):
+    def test_no_home_directory_search(self, tmp_path, tmp_path_factory, monkeypatch):
         """Test disabling home directory search."""
         # Create config only in mock home directory
         home_config = tmp_path / "myapp"
@@ -125,17 +119,12 @@ class TestConfigDiscovery:
         # Mock home directory
         with patch("pathlib.Path.home", return_value=tmp_path):
             # Create separate work directory that's not under tmp_path
-            with tempfile.TemporaryDirectory() as work_dir:
-                original_cwd = Path.cwd()
-                try:
-                    os.chdir(work_dir)
+            monkeypatch.chdir(tmp_path_factory.mktemp("work"))
 
-                    discovery = ConfigDiscovery("myapp", search_home=False)
+            discovery = ConfigDiscovery("myapp", search_home=False)
 
-                    with pytest.raises(ConfigNotFoundError):
-                        discovery.discover_config_files()
-                finally:
-                    os.chdir(original_cwd)
+            with pytest.raises(ConfigNotFoundError):
+                discovery.discover_config_files()
 
     def test_custom_extensions(self, tmp_path):
         """Test using custom file extensions."""
@@ -241,3 +230,55 @@ class TestConfigDiscovery:
             assert expected_path in error_msg.replace("\\\\", "\\")
         finally:
             os.chdir(original_cwd)
+
+    def test_extension_order_preserved(self, tmp_path, monkeypatch):
+        """Test that files are reported in extension order."""
+        config_dir = tmp_path / "myapp"
+        config_dir.mkdir()
+        for name in ["config.toml", "config.json", "config.yaml", "other.yaml"]:
+            (config_dir / name).write_text("{}")
+        monkeypatch.chdir(tmp_path)
+
+        discovery = ConfigDiscovery(
+            "myapp", extensions=["yaml", "json", "toml"], search_home=False
+        )
+        files = discovery.discover_config_files()
+
+        assert [f.name for f in files] == ["config.yaml", "config.json", "config.toml"]
+
+    def test_created_directories_and_files_found(self, tmp_path, monkeypatch):
+        """Test that config created after a lookup is found by the same instance."""
+        monkeypatch.chdir(tmp_path)
+        discovery = ConfigDiscovery("myapp", search_home=False)
+
+        with pytest.raises(ConfigNotFoundError):
+            discovery.discover_config_files()
+
+        # Created within the same timestamp tick as the failed lookup
+        config_dir = tmp_path / "myapp"
+        config_dir.mkdir()
+        (config_dir / "config.yaml").write_text("test: value")
+        assert discovery.discover_config_files() == [config_dir / "config.yaml"]
+
+        (config_dir / "config.json").write_text("{}")
+        assert discovery.discover_config_files() == [
+            config_dir / "config.yaml",
+            config_dir / "config.json",
+        ]
+
+    def test_start_dir(self, tmp_path):
+        """Test searching upward from a given directory instead of the cwd."""
+        config_dir = tmp_path / "myapp"
+        config_dir.mkdir()
+        (config_dir / "config.yaml").write_text("test: value")
+        sub_dir = tmp_path / "project" / "src"
+        sub_dir.mkdir(parents=True)
+
+        discovery = ConfigDiscovery("myapp", search_home=False, start_dir=sub_dir)
+
+        assert discovery.discover_config_files() == [config_dir / "config.yaml"]
+
+        missing = ConfigDiscovery("other", search_home=False, start_dir=str(sub_dir))
+        with pytest.raises(ConfigNotFoundError) as exc_info:
+            missing.discover_config_files()
+        assert str(sub_dir / "other") in str(exc_info.value).replace("\\\\", "\\")
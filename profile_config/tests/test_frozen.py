@@ -0,0 +1,94 @@
+"""
+Tests for read-only configuration views.
+"""
+
+import pytest
+
+from profile_config import FrozenDict, FrozenList, ProfileConfigResolver
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty caches."""
+    ProfileConfigResolver.clear_cache()
+    yield
+    ProfileConfigResolver.clear_cache()
+
+
+class TestFrozenViews:
+    """Test the read-only view types."""
+
+    def test_nested_values_are_views(self):
+        """Test that nested sections are wrapped and cannot be modified."""
+        data = {"database": {"hosts": ["a", "b"], "port": 5432}}
+        view = FrozenDict(data)
+
+        assert isinstance(view["database"], FrozenDict)
+        assert isinstance(view["database"]["hosts"], FrozenList)
+        assert view["database"]["hosts"][1:] == ["b"]
+        assert view == data
+        assert "database" in view and len(view) == 1
+
+        with pytest.raises(TypeError):
+            view["database"]["port"] = 1  # type: ignore[index]
+        with pytest.raises(TypeError):
+            view["database"]["hosts"][0] = "c"  # type: ignore[index]
+
+    def test_copy_is_mutable_and_independent(self):
+        """Test that copy() returns a deep, mutable copy."""
+        data = {"database": {"hosts": ["a", "b"]}}
+        view = FrozenDict(data)
+
+        copied = view.copy()
+        copied["database"]["hosts"].append("c")
+        hosts = view["database"]["hosts"].copy()
+        hosts.append("d")
+
+        assert data == {"database": {"hosts": ["a", "b"]}}
+
+
+class TestResolveFrozen:
+    """Test resolving configurations as read-only views."""
+
+    CONFIG = """
+defaults:
+  database:
+    host: localhost
+    options: [ssl]
+
+profiles:
+  dev:
+    database:
+      name: dev_db
+"""
+
+    def test_resolve_frozen_matches_resolve(self, tmp_path, monkeypatch):
+        """Test that the view has the same contents as resolve()."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+
+        assert resolver.resolve_frozen() == resolver.resolve()
+        assert resolver.resolve_frozen(profile="default") == {
+            "database": {"host": "localhost", "options": ["ssl"]}
+        }
+
+    def test_resolve_frozen_does_not_copy(self, tmp_path, monkeypatch):
+        """Test that cached results are viewed rather than copied."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(self.CONFIG)
+
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        resolver.resolve()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("configuration was copied")
+
+        monkeypatch.setattr("profile_config.resolver._clone", fail)
+        config = resolver.resolve_frozen()
+
+        assert config["database"]["name"] == "dev_db"
+        assert config["database"]["options"][0] == "ssl"
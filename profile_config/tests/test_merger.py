@@ -0,0 +1,266 @@
+"""
+Tests for configuration merging.
+"""
+
+import datetime
+import subprocess
+import sys
+
+import pytest
+
+from profile_config import merger
+from profile_config.merger import ConfigMerger
+
+
+class TestConfigMerger:
+    """Test configuration merging functionality."""
+
+    def test_merge_no_sources(self):
+        """Test merging with no sources returns an empty dict."""
+        assert ConfigMerger().merge_configs() == {}
+
+    def test_merge_nested_dicts(self):
+        """Test that nested dictionaries are deep-merged."""
+        base = {"database": {"host": "localhost", "options": {"timeout": 30}}}
+        override = {"database": {"options": {"pool_size": 10}}, "debug": True}
+
+        result = ConfigMerger().merge_configs(
+            base, override, enable_interpolation=False
+        )
+
+        assert result == {
+            "database": {
+                "host": "localhost",
+                "options": {"timeout": 30, "pool_size": 10},
+            },
+            "debug": True,
+        }
+
+    def test_merge_replaces_lists_and_scalars(self):
+        """Test that lists and mismatched types are replaced, not merged."""
+        base = {"hosts": ["a", "b"], "cache": {"enabled": True}, "port": 80}
+        override = {"hosts": ["c"], "cache": None, "port": {"http": 80}}
+
+        result = ConfigMerger().merge_configs(
+            base, override, enable_interpolation=False
+        )
+
+        assert result == {"hosts": ["c"], "cache": None, "port": {"http": 80}}
+
+    def test_missing_marker_keeps_earlier_value(self):
+        """Test that a later '???' value does not override, as with OmegaConf."""
+        sources = [
+            {"a": 1, "b": {"x": 1}, "c": ["item"]},
+            {"a": "???", "b": "???", "c": "???", "d": "???"},
+            {"b": {"y": 2}},
+        ]
+
+        result = ConfigMerger().merge_configs(*sources, enable_interpolation=False)
+
+        assert result == {"a": 1, "b": {"x": 1, "y": 2}, "c": ["item"], "d": "???"}
+
+    def test_merge_many_sources_in_order(self):
+        """Test precedence across more than two sources."""
+        sources = [
+            {"a": {"x": 1, "y": 1}, "b": {"k": "base"}},
+            {"a": "scalar", "b": {"k": "middle", "m": True}},
+            {"a": {"z": 3}, "b": {"k": "top"}},
+        ]
+
+        result = ConfigMerger().merge_configs(*sources, enable_interpolation=False)
+
+        # A scalar discards earlier dicts; later dicts start afresh
+        assert result == {"a": {"z": 3}, "b": {"k": "top", "m": True}}
+
+    def test_merge_does_not_mutate_sources(self):
+        """Test that merging leaves the input dictionaries untouched."""
+        base = {"database": {"host": "localhost"}}
+        override = {"database": {"name": "app"}, "servers": [{"name": "s1"}]}
+
+        result = ConfigMerger().merge_configs(
+            base, override, enable_interpolation=False
+        )
+        result["database"]["host"] = "mutated"
+        result["servers"][0]["name"] = "mutated"
+
+        assert base == {"database": {"host": "localhost"}}
+        assert override == {"database": {"name": "app"}, "servers": [{"name": "s1"}]}
+
+    def test_merge_keeps_interpolation_markers(self):
+        """Test that interpolation strings are preserved when disabled."""
+        result = ConfigMerger().merge_configs(
+            {"base": "/app"}, {"data": "${base}/data"}, enable_interpolation=False
+        )
+
+        assert result == {"base": "/app", "data": "${base}/data"}
+
+    def test_interpolation_chained_references(self):
+        """Test that references to interpolated values resolve fully."""
+        result = ConfigMerger().merge_configs(
+            {
+                "app_name": "myapp",
+                "base_path": "/opt/${app_name}",
+                "data_path": "${base_path}/data",
+                "database_url": "sqlite:///${data_path}/app.db",
+            }
+        )
+
+        assert result["base_path"] == "/opt/myapp"
+        assert result["data_path"] == "/opt/myapp/data"
+        assert result["database_url"] == "sqlite:////opt/myapp/data/app.db"
+
+    def test_interpolation_nested_paths_and_types(self):
+        """Test dotted references and type preservation of whole-value references."""
+        result = ConfigMerger().merge_configs(
+            {
+                "database": {"host": "db", "port": 5432},
+                "port": "${database.port}",
+                "url": "postgresql://${database.host}:${database.port}",
+                "db_copy": "${database}",
+            }
+        )
+
+        assert result["port"] == 5432
+        assert result["url"] == "postgresql://db:5432"
+        assert result["db_copy"] == {"host": "db", "port": 5432}
+
+    def test_interpolation_resolver_syntax(self, monkeypatch):
+        """Test that resolver syntax such as ${env:VAR} is still supported."""
+        monkeypatch.setenv("MERGER_TEST_VAR", "from_env")
+
+        result = ConfigMerger().merge_configs(
+            {"name": "app", "value": "${env:MERGER_TEST_VAR}/${name}"}
+        )
+
+        assert result["value"] == "from_env/app"
+
+    def test_unsupported_syntax_rejected_before_copying(self, monkeypatch):
+        """Test that native interpolation bails out before copying the config."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("configuration was copied")
+
+        monkeypatch.setattr(merger, "_clone", fail)
+
+        with pytest.raises(merger._UnsupportedInterpolation):
+            merger._interpolate({"name": "app", "value": "${env:HOME}/${name}"})
+
+    def test_interpolation_failure_leaves_values_unresolved(self):
+        """Test that a missing reference leaves interpolations untouched."""
+        result = ConfigMerger().merge_configs({"a": "${missing}", "b": "plain"})
+
+        assert result == {"a": "${missing}", "b": "plain"}
+
+    def test_interpolation_failure_keeps_resolvable_values(self, monkeypatch, caplog):
+        """Test that one unresolvable value does not block the others."""
+        monkeypatch.setenv("MERGER_TEST_VAR", "from_env")
+
+        result = ConfigMerger().merge_configs(
+            {
+                "name": "app",
+                "env": "${env:MERGER_TEST_VAR}",
+                "label": "${name}-${missing}",
+                "section": {"inner": "${name}"},
+                "copy": "${section}",
+            }
+        )
+
+        assert result == {
+            "name": "app",
+            "env": "from_env",
+            "label": "${name}-${missing}",
+            "section": {"inner": "app"},
+            "copy": {"inner": "app"},
+        }
+        assert "Variable interpolation failed: label" in caplog.text
+
+    def test_interpolation_reference_to_interpolated_section(self):
+        """Test copying a section whose values are themselves interpolated."""
+        result = ConfigMerger().merge_configs(
+            {
+                "paths": {"base": "/opt/${name}", "logs": "${paths.base}/logs"},
+                "copy": "${paths}",
+                "name": "myapp",
+            }
+        )
+
+        assert result["copy"] == {"base": "/opt/myapp", "logs": "/opt/myapp/logs"}
+
+    def test_interpolation_cycle(self, caplog):
+        """Test that circular references are reported and left unresolved."""
+        config = {"a": "${b}", "b": "x_${a}", "c": "${a}"}
+
+        result = ConfigMerger().merge_configs(config)
+
+        assert result == config
+        assert "circular reference involving: a, b, c" in caplog.text
+
+    def test_merged_values_are_copies(self):
+        """Test that merge results do not share containers with the sources."""
+        created = datetime.date(2024, 1, 1)
+        base = {"items": [{"name": "a"}], "tags": {"x"}, "created": created}
+
+        result = ConfigMerger().merge_configs(base, enable_interpolation=False)
+        result["items"][0]["name"] = "changed"
+        result["tags"].add("y")
+
+        assert base == {"items": [{"name": "a"}], "tags": {"x"}, "created": created}
+
+    def test_merge_without_markers_skips_interpolation(self, monkeypatch):
+        """Test that configs without ${ markers never reach OmegaConf."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("OmegaConf was used")
+
+        monkeypatch.setattr("omegaconf.OmegaConf.create", fail)
+        created = datetime.date(2024, 1, 1)
+
+        result = ConfigMerger().merge_configs(
+            {"database": {"host": "localhost"}, "created": created},
+            {"database": {"port": 5432}},
+        )
+
+        assert result == {
+            "database": {"host": "localhost", "port": 5432},
+            "created": created,
+        }
+
+    def test_single_source_is_copied_without_merging(self, monkeypatch):
+        """Test that a lone source is copied rather than merged."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("single source was merged")
+
+        monkeypatch.setattr("profile_config.merger._merge_all", fail)
+        monkeypatch.setattr("omegaconf.OmegaConf.create", fail)
+        source = {"database": {"host": "localhost"}, "items": [1, 2]}
+
+        result = ConfigMerger().merge_configs({}, source)
+        result["database"]["host"] = "changed"
+
+        assert result == {"database": {"host": "changed"}, "items": [1, 2]}
+        assert source == {"database": {"host": "localhost"}, "items": [1, 2]}
+
+    def test_interpolation_with_unsupported_omegaconf_values(self):
+        """Test that values OmegaConf cannot hold, like dates, can be referenced."""
+        created = datetime.date(2024, 1, 1)
+
+        result = ConfigMerger().merge_configs(
+            {"created": created, "copy": "${created}"}
+        )
+
+        assert result == {"created": created, "copy": created}
+
+    def test_omegaconf_imported_only_when_needed(self):
+        """Test that plain configurations never import OmegaConf."""
+        code = (
+            "import sys\n"
+            "from profile_config import ProfileConfigResolver\n"
+            "resolver = ProfileConfigResolver.from_string(\n"
+            "    'defaults: {name: app, url: \"${name}/x\"}'\n"
+            ")\n"
+            "assert resolver.resolve() == {'name': 'app', 'url': 'app/x'}\n"
+            "assert 'omegaconf' not in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -2,9 +2,13 @@
 Tests for profile resolution with inheritance.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from profile_config.exceptions import CircularInheritanceError, ProfileNotFoundError
+from profile_config.merger import ConfigMerger
 from profile_config.profiles import ProfileResolver
 
 
@@ -31,6 +35,24 @@ class TestProfileResolver:
         expected = {"key1": "default_value", "key2": "root_value"}
         assert result == expected
 
+    def test_result_shares_no_data_with_config(self):
+        """Test that results without a profiles section or profile are deep copies."""
+        config_data = {"defaults": {"db": {"host": "localhost"}}, "extra": {"a": [1]}}
+
+        resolver = ProfileResolver()
+        result = resolver.resolve_profile(config_data, "any_profile")
+        result["db"]["host"] = "changed"
+        result["extra"]["a"].append(2)
+        defaults_only = resolver.resolve_profile(
+            {"defaults": config_data["defaults"], "profiles": {"dev": {}}}, "default"
+        )
+        defaults_only["db"]["host"] = "changed"
+
+        assert config_data == {
+            "defaults": {"db": {"host": "localhost"}},
+            "extra": {"a": [1]},
+        }
+
     def test_resolve_simple_profile(self):
         """Test resolving a simple profile without inheritance."""
         config_data = {
@@ -158,6 +180,216 @@ class TestProfileResolver:
 
         assert "Circular inheritance detected" in str(exc_info.value)
 
+    def test_circular_inheritance_reports_chain_in_order(self):
+        """Test that the cycle is reported in inheritance order."""
+        config_data = {
+            "profiles": {
+                "a": {"inherits": "b"},
+                "b": {"inherits": "c"},
+                "c": {"inherits": "a"},
+            }
+        }
+
+        resolver = ProfileResolver()
+
+        with pytest.raises(CircularInheritanceError) as exc_info:
+            resolver.resolve_profile(config_data, "a")
+
+        assert "a -> b -> c -> a" in str(exc_info.value)
+
+    def test_circular_inheritance_error_carries_path(self):
+        """Test that the cycle is available as data and survives pickling."""
+        config_data = {
+            "profiles": {
+                "dev": {"inherits": "a"},
+                "a": {"inherits": "b"},
+                "b": {"inherits": "a"},
+            }
+        }
+
+        resolver = ProfileResolver()
+
+        with pytest.raises(CircularInheritanceError) as exc_info:
+            resolver.resolve_profile(config_data, "dev")
+
+        assert exc_info.value.path == ["dev", "a", "b", "a"]
+        restored = pickle.loads(pickle.dumps(exc_info.value))
+        assert restored.path == exc_info.value.path
+        assert str(restored) == "Circular inheritance detected: dev -> a -> b -> a"
+        assert restored.args == exc_info.value.args == (str(exc_info.value),)
+        assert str(CircularInheritanceError("custom")) == "custom"
+        assert CircularInheritanceError("custom").args == ("custom",)
+
+    def test_cycle_does_not_affect_unrelated_profiles(self):
+        """Test that a cycle elsewhere does not prevent resolving valid profiles."""
+        config_data = {
+            "profiles": {
+                "base": {"key": "base_value"},
+                "dev": {"inherits": "base", "debug": True},
+                "x": {"inherits": "y"},
+                "y": {"inherits": "x"},
+            }
+        }
+
+        resolver = ProfileResolver()
+        result = resolver.resolve_profile(config_data, "dev")
+
+        assert result == {"key": "base_value", "debug": True}
+
+    def test_missing_parent_profile(self):
+        """Test that inheriting from an undefined profile raises an error."""
+        config_data = {"profiles": {"dev": {"inherits": "missing"}}}
+
+        resolver = ProfileResolver()
+
+        with pytest.raises(ProfileNotFoundError) as exc_info:
+            resolver.resolve_profile(config_data, "dev")
+
+        assert "Profile 'missing' not found in inheritance chain" in str(exc_info.value)
+
+    def test_inheritance_chains_computed_once(self, monkeypatch):
+        """Test that chains are computed once for unchanged inheritance links."""
+        config_data = {
+            "profiles": {
+                "base": {"key": "base_value"},
+                "dev": {"inherits": "base"},
+                "prod": {"inherits": "base"},
+            }
+        }
+
+        resolver = ProfileResolver()
+        calls = []
+        build_chains = ProfileResolver._build_chains
+
+        def counting_build_chains(links):
+            calls.append(links)
+            return build_chains(links)
+
+        monkeypatch.setattr(
+            ProfileResolver, "_build_chains", staticmethod(counting_build_chains)
+        )
+
+        resolver.resolve_profile(config_data, "dev")
+        resolver.resolve_profile(config_data, "prod")
+        resolver.resolve_profile(copy.deepcopy(config_data), "dev")
+
+        assert len(calls) == 1
+
+    def test_resolve_profiles_merges_shared_ancestors_once(self, monkeypatch):
+        """Test that resolving several profiles merges a common parent once."""
+        config_data = {
+            "defaults": {"timeout": 30},
+            "profiles": {
+                "base": {"database": {"host": "localhost", "port": 5432}},
+                "staging": {"inherits": "base", "database": {"name": "stage"}},
+                "dev": {"inherits": "staging", "debug": True},
+                "prod": {"inherits": "base", "database": {"host": "prod"}},
+            },
+        }
+
+        resolver = ProfileResolver()
+        expected = {
+            name: resolver.resolve_profile(config_data, name)
+            for name in ["dev", "prod", "staging"]
+        }
+
+        settings_calls = []
+        own_settings = ProfileResolver._own_settings
+
+        def counting_own_settings(self, profile):
+            settings_calls.append(profile)
+            return own_settings(self, profile)
+
+        monkeypatch.setattr(ProfileResolver, "_own_settings", counting_own_settings)
+        result = resolver.resolve_profiles(config_data, ["dev", "prod", "staging"])
+
+        assert result == expected
+        assert list(result) == ["dev", "prod", "staging"]
+        assert len(settings_calls) == 4
+
+    def test_defaults_and_chain_merged_once(self, monkeypatch):
+        """Test that defaults and all ancestors are merged in a single pass."""
+        config_data = {
+            "defaults": {"database": {"host": "localhost"}},
+            "profiles": {
+                "base": {"database": {"port": 5432}},
+                "dev": {"inherits": "base", "database": {"name": "dev_db"}},
+            },
+        }
+
+        resolver = ProfileResolver()
+        calls = []
+        merge_configs = ConfigMerger.merge_configs
+
+        def counting_merge(self, *sources, **kwargs):
+            calls.append(sources)
+            return merge_configs(self, *sources, **kwargs)
+
+        monkeypatch.setattr(ConfigMerger, "merge_configs", counting_merge)
+        result = resolver.resolve_profile(config_data, "dev")
+
+        assert result == {
+            "database": {"host": "localhost", "port": 5432, "name": "dev_db"}
+        }
+        assert len(calls) == 1
+        assert config_data["profiles"]["dev"]["inherits"] == "base"
+
+    def test_profile_without_parent_skips_chains(self, monkeypatch):
+        """Test that a profile without inherit key is resolved without chains."""
+        config_data = {
+            "defaults": {"database": {"host": "localhost"}},
+            "profiles": {
+                "dev": {"database": {"name": "dev_db"}},
+                "loop": {"inherits": "loop"},
+            },
+        }
+
+        def fail(self, profiles):
+            raise AssertionError("inheritance chains were computed")
+
+        monkeypatch.setattr(ProfileResolver, "_get_chains", fail)
+        resolver = ProfileResolver()
+        result = resolver.resolve_profile(config_data, "dev")
+
+        assert result == {"database": {"host": "localhost", "name": "dev_db"}}
+        result["database"]["name"] = "changed"
+        assert config_data["profiles"]["dev"]["database"]["name"] == "dev_db"
+
+    def test_long_inheritance_chain(self):
+        """Test that chains deeper than the recursion limit resolve and fail cleanly."""
+        depth = 1500
+        profiles = {
+            f"p{i}": {"inherits": f"p{i + 1}", f"k{i}": i} for i in range(depth)
+        }
+        profiles[f"p{depth}"] = {"root": True}
+
+        resolver = ProfileResolver()
+        result = resolver.resolve_profile({"profiles": profiles}, "p0")
+
+        assert len(result) == depth + 1
+        assert result["root"] is True
+
+        profiles[f"p{depth}"] = {"inherits": "p0"}
+        with pytest.raises(CircularInheritanceError) as exc_info:
+            resolver.resolve_profile({"profiles": profiles}, "p0")
+        assert str(exc_info.value).endswith(f"p{depth} -> p0")
+
+    def test_inheritance_chains_follow_changed_links(self):
+        """Test that editing a profile's parent in place is picked up."""
+        config_data = {
+            "profiles": {
+                "base": {"key": "base_value"},
+                "other": {"key": "other_value"},
+                "dev": {"inherits": "base"},
+            }
+        }
+
+        resolver = ProfileResolver()
+        assert resolver.resolve_profile(config_data, "dev") == {"key": "base_value"}
+
+        config_data["profiles"]["dev"]["inherits"] = "other"
+        assert resolver.resolve_profile(config_data, "dev") == {"key": "other_value"}
+
     def test_inherit_key_not_removed_from_result(self):
         """Test that inherit key is removed from final result."""
         config_data = {
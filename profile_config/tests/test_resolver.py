@@ -2,26 +2,32 @@
 Tests for the main ProfileConfigResolver.
 """
 
-import contextlib
 import os
-import tempfile
-from pathlib import Path
 
 import pytest
 
 from profile_config import ProfileConfigResolver
-from profile_config.exceptions import ConfigNotFoundError, ProfileNotFoundError
+from profile_config.exceptions import (
+    ConfigFormatError,
+    ConfigNotFoundError,
+    ProfileNotFoundError,
+)
+from profile_config.merger import ConfigMerger
 
 
-@contextlib.contextmanager
-def chdir_context(path):
-    """Context manager to temporarily change directory (Windows-safe)."""
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(path)
-        yield
-    finally:
-        os.chdir(original_cwd)
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """Run in an empty directory; returns a function writing <name>/config.yaml."""
+    monkeypatch.chdir(tmp_path)
+
+    def write(text, name="myapp"):
+        config_dir = tmp_path / name
+        config_dir.mkdir(exist_ok=True)
+        config_file = config_dir / "config.yaml"
+        config_file.write_text(text)
+        return config_file
+
+    return write
 
 
 class TestProfileConfigResolver:
@@ -53,15 +59,22 @@ class TestProfileConfigResolver:
         assert resolver.override_list == [overrides]
         assert resolver.enable_interpolation is False
 
-    def test_resolve_simple_config(self):
-        """Test resolving a simple configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
+    def test_instances_use_slots(self):
+        """Test that resolver components do not carry an instance __dict__."""
+        resolver = ProfileConfigResolver("myapp")
 
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        for component in (
+            resolver,
+            resolver.discovery,
+            resolver.loader,
+            resolver.profile_resolver,
+            resolver.merger,
+        ):
+            assert not hasattr(component, "__dict__")
+
+    def test_resolve_simple_config(self, app_config):
+        """Test resolving a simple configuration."""
+        app_config("""
 defaults:
   database: sqlite:///default.db
   debug: false
@@ -72,21 +85,15 @@ profiles:
     database: sqlite:///dev.db
 """)
 
-            resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        result = resolver.resolve()
 
-            expected = {"database": "sqlite:///dev.db", "debug": True}
-            assert result == expected
+        expected = {"database": "sqlite:///dev.db", "debug": True}
+        assert result == expected
 
-    def test_resolve_with_inheritance(self):
+    def test_resolve_with_inheritance(self, app_config):
         """Test resolving configuration with profile inheritance."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 defaults:
   timeout: 30
 
@@ -101,26 +108,20 @@ profiles:
     port: 3000
 """)
 
-            resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        result = resolver.resolve()
 
-            expected = {
-                "timeout": 30,  # From defaults
-                "database": "sqlite:///base.db",  # From base profile
-                "debug": True,  # Dev overrides base
-                "port": 3000,  # Dev-specific
-            }
-            assert result == expected
+        expected = {
+            "timeout": 30,  # From defaults
+            "database": "sqlite:///base.db",  # From base profile
+            "debug": True,  # Dev overrides base
+            "port": 3000,  # Dev-specific
+        }
+        assert result == expected
 
-    def test_resolve_with_overrides(self):
+    def test_resolve_with_overrides(self, app_config):
         """Test resolving configuration with overrides."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 defaults:
   database: sqlite:///default.db
   port: 8000
@@ -130,33 +131,28 @@ profiles:
     debug: true
 """)
 
-            overrides = {
-                "database": "postgresql://localhost/override",
-                "new_key": "override_value",
-            }
+        overrides = {
+            "database": "postgresql://localhost/override",
+            "new_key": "override_value",
+        }
 
-            resolver = ProfileConfigResolver(
-                "myapp", profile="dev", overrides=overrides, search_home=False
-            )
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver(
+            "myapp", profile="dev", overrides=overrides, search_home=False
+        )
+        result = resolver.resolve()
 
-            expected = {
-                "database": "postgresql://localhost/override",  # Override wins
-                "port": 8000,  # From defaults
-                "debug": True,  # From profile
-                "new_key": "override_value",  # From overrides
-            }
-            assert result == expected
+        expected = {
+            "database": "postgresql://localhost/override",  # Override wins
+            "port": 8000,  # From defaults
+            "debug": True,  # From profile
+            "new_key": "override_value",  # From overrides
+        }
+        assert result == expected
 
-    def test_resolve_multiple_config_files(self):
+    def test_resolve_multiple_config_files(self, app_config, tmp_path, monkeypatch):
         """Test resolving with multiple configuration files."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create base config in parent directory
-            parent_config_dir = Path(tmpdir) / "myapp"
-            parent_config_dir.mkdir()
-            parent_config = parent_config_dir / "config.yaml"
-            parent_config.write_text("""
+        # Create base config in parent directory
+        app_config("""
 defaults:
   database: sqlite:///parent.db
   timeout: 30
@@ -166,13 +162,12 @@ profiles:
     debug: false
 """)
 
-            # Create more specific config in subdirectory
-            sub_dir = Path(tmpdir) / "project"
-            sub_dir.mkdir()
-            sub_config_dir = sub_dir / "myapp"
-            sub_config_dir.mkdir()
-            sub_config = sub_config_dir / "config.yaml"
-            sub_config.write_text("""
+        # Create more specific config in subdirectory
+        sub_dir = tmp_path / "project"
+        sub_config_dir = sub_dir / "myapp"
+        sub_config_dir.mkdir(parents=True)
+        sub_config = sub_config_dir / "config.yaml"
+        sub_config.write_text("""
 defaults:
   database: sqlite:///project.db
 
@@ -182,29 +177,23 @@ profiles:
     port: 3000
 """)
 
-            # Change to subdirectory
-            os.chdir(sub_dir)
+        # Change to subdirectory
+        monkeypatch.chdir(sub_dir)
 
-            resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        result = resolver.resolve()
 
-            expected = {
-                "database": "sqlite:///project.db",  # More specific config wins
-                "timeout": 30,  # From parent config
-                "debug": True,  # More specific config wins
-                "port": 3000,  # From more specific config
-            }
-            assert result == expected
+        expected = {
+            "database": "sqlite:///project.db",  # More specific config wins
+            "timeout": 30,  # From parent config
+            "debug": True,  # More specific config wins
+            "port": 3000,  # From more specific config
+        }
+        assert result == expected
 
-    def test_resolve_with_interpolation(self):
+    def test_resolve_with_interpolation(self, app_config):
         """Test resolving configuration with variable interpolation."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file with interpolation
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 defaults:
   base_path: /app
   data_path: ${base_path}/data
@@ -215,80 +204,62 @@ profiles:
     base_path: /dev/app
 """)
 
-            resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver("myapp", profile="dev", search_home=False)
+        result = resolver.resolve()
 
-            expected = {
-                "base_path": "/dev/app",
-                "data_path": "/dev/app/data",  # Interpolated
-                "log_path": "/dev/app/logs",  # Interpolated
-            }
-            assert result == expected
+        expected = {
+            "base_path": "/dev/app",
+            "data_path": "/dev/app/data",  # Interpolated
+            "log_path": "/dev/app/logs",  # Interpolated
+        }
+        assert result == expected
 
-    def test_resolve_interpolation_disabled(self):
+    def test_resolve_interpolation_disabled(self, app_config):
         """Test resolving configuration with interpolation disabled."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file with interpolation
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 defaults:
   base_path: /app
   data_path: ${base_path}/data
 """)
 
-            resolver = ProfileConfigResolver(
-                "myapp", search_home=False, enable_interpolation=False
-            )
-            result = resolver.resolve()
+        resolver = ProfileConfigResolver(
+            "myapp", search_home=False, enable_interpolation=False
+        )
+        result = resolver.resolve()
 
-            expected = {
-                "base_path": "/app",
-                "data_path": "${base_path}/data",  # Not interpolated
-            }
-            assert result == expected
+        expected = {
+            "base_path": "/app",
+            "data_path": "${base_path}/data",  # Not interpolated
+        }
+        assert result == expected
 
-    def test_resolve_nonexistent_profile(self):
+    def test_resolve_nonexistent_profile(self, app_config):
         """Test resolving a nonexistent profile."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 profiles:
   dev:
     debug: true
 """)
 
-            resolver = ProfileConfigResolver(
-                "myapp", profile="nonexistent", search_home=False
-            )
+        resolver = ProfileConfigResolver(
+            "myapp", profile="nonexistent", search_home=False
+        )
 
-            with pytest.raises(ProfileNotFoundError):
-                resolver.resolve()
+        with pytest.raises(ProfileNotFoundError):
+            resolver.resolve()
 
-    def test_resolve_no_config_files(self):
+    def test_resolve_no_config_files(self, tmp_path, monkeypatch):
         """Test resolving when no config files exist."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
+        monkeypatch.chdir(tmp_path)
 
-            resolver = ProfileConfigResolver("nonexistent", search_home=False)
+        resolver = ProfileConfigResolver("nonexistent", search_home=False)
 
-            with pytest.raises(ConfigNotFoundError):
-                resolver.resolve()
+        with pytest.raises(ConfigNotFoundError):
+            resolver.resolve()
 
-    def test_list_profiles(self):
+    def test_list_profiles(self, app_config):
         """Test listing available profiles."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("""
+        app_config("""
 profiles:
   dev:
     debug: true
@@ -298,55 +269,80 @@ profiles:
     debug: false
 """)
 
-            resolver = ProfileConfigResolver("myapp", search_home=False)
-            profiles = resolver.list_profiles()
+        resolver = ProfileConfigResolver("myapp", search_home=False)
+        profiles = resolver.list_profiles()
 
-            assert set(profiles) == {"dev", "staging", "prod"}
+        assert set(profiles) == {"dev", "staging", "prod"}
 
-    def test_list_profiles_no_config(self):
+    def test_list_profiles_across_files(self, tmp_path, monkeypatch):
+        """Test that profiles from all discovered files are listed once, in order."""
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(
+            "profiles:\n  base: {}\n  shared: {}\n"
+        )
+        project = tmp_path / "project"
+        (project / "myapp").mkdir(parents=True)
+        (project / "myapp" / "config.yaml").write_text(
+            "profiles:\n  local: {}\n  shared: {debug: true}\n"
+        )
+        monkeypatch.chdir(project)
+
+        resolver = ProfileConfigResolver("myapp", search_home=False)
+
+        assert resolver.list_profiles() == ["local", "shared", "base"]
+
+    def test_config_files_loaded_in_order(self, tmp_path, monkeypatch):
+        """Test that files keep their precedence and a broken file is skipped."""
+        (tmp_path / "myapp").mkdir()
+        (tmp_path / "myapp" / "config.yaml").write_text(
+            "defaults:\n  source: parent\n  timeout: 30\n"
+        )
+        middle = tmp_path / "middle"
+        (middle / "myapp").mkdir(parents=True)
+        (middle / "myapp" / "config.yaml").write_text("defaults: [unclosed\n")
+        project = middle / "project"
+        (project / "myapp").mkdir(parents=True)
+        (project / "myapp" / "config.yaml").write_text("defaults:\n  source: project\n")
+        monkeypatch.chdir(project)
+
+        resolver = ProfileConfigResolver("myapp", search_home=False, cache_size=0)
+
+        assert resolver.resolve() == {"source": "project", "timeout": 30}
+
+    def test_list_profiles_no_config(self, tmp_path, monkeypatch):
         """Test listing profiles when no config files exist."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
+        monkeypatch.chdir(tmp_path)
 
-            resolver = ProfileConfigResolver("nonexistent", search_home=False)
-            profiles = resolver.list_profiles()
+        resolver = ProfileConfigResolver("nonexistent", search_home=False)
+        profiles = resolver.list_profiles()
 
-            assert profiles == []
+        assert profiles == []
 
-    def test_get_config_files(self):
+    def test_get_config_files(self, app_config):
         """Test getting discovered configuration files."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-
-            # Create config file
-            config_dir = Path(tmpdir) / "myapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-            config_file.write_text("test: value")
+        config_file = app_config("test: value")
 
-            resolver = ProfileConfigResolver("myapp", search_home=False)
-            files = resolver.get_config_files()
+        resolver = ProfileConfigResolver("myapp", search_home=False)
+        files = resolver.get_config_files()
 
-            assert len(files) == 1
-            # Resolve both paths to handle macOS /private/var vs /var symlink
-            assert files[0].resolve() == config_file.resolve()
+        assert len(files) == 1
+        # Resolve both paths to handle macOS /private/var vs /var symlink
+        assert files[0].resolve() == config_file.resolve()
 
-    def test_get_config_files_no_config(self):
+    def test_get_config_files_no_config(self, tmp_path, monkeypatch):
         """Test getting config files when none exist."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
+        monkeypatch.chdir(tmp_path)
 
-            resolver = ProfileConfigResolver("nonexistent", search_home=False)
-            files = resolver.get_config_files()
+        resolver = ProfileConfigResolver("nonexistent", search_home=False)
+        files = resolver.get_config_files()
 
-            assert files == []
+        assert files == []
 
-    def test_default_profile_auto_creation(self):
+    def test_default_profile_auto_creation(self, app_config):
         """Test that 'default' profile auto-creates when not defined."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-            config_dir = Path(tmpdir) / "testapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-
-            # Config WITHOUT a "default" profile
-            config_file.write_text("""
+        # Config WITHOUT a "default" profile
+        app_config(
+            """
 defaults:
   host: localhost
   port: 5432
@@ -360,25 +356,23 @@ profiles:
   production:
     host: prod-db.com
     debug: false
-""")
+""",
+            name="testapp",
+        )
 
-            # Should work and return only defaults
-            resolver = ProfileConfigResolver(
-                "testapp", profile="default", search_home=False
-            )
-            config = resolver.resolve()
+        # Should work and return only defaults
+        resolver = ProfileConfigResolver(
+            "testapp", profile="default", search_home=False
+        )
+        config = resolver.resolve()
 
-            assert config == {"host": "localhost", "port": 5432, "timeout": 30}
+        assert config == {"host": "localhost", "port": 5432, "timeout": 30}
 
-    def test_explicit_default_profile_takes_precedence(self):
+    def test_explicit_default_profile_takes_precedence(self, app_config):
         """Test that explicit 'default' profile is used when it exists."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-            config_dir = Path(tmpdir) / "testapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-
-            # Config WITH an explicit "default" profile
-            config_file.write_text("""
+        # Config WITH an explicit "default" profile
+        app_config(
+            """
 defaults:
   host: localhost
   port: 5432
@@ -391,44 +385,268 @@ profiles:
 
   development:
     debug: true
-""")
+""",
+            name="testapp",
+        )
 
-            resolver = ProfileConfigResolver(
-                "testapp", profile="default", search_home=False
-            )
-            config = resolver.resolve()
+        resolver = ProfileConfigResolver(
+            "testapp", profile="default", search_home=False
+        )
+        config = resolver.resolve()
 
-            # Should use explicit default profile (overrides timeout, adds custom)
-            assert config == {
-                "host": "localhost",
-                "port": 5432,
-                "timeout": 60,
-                "custom": True,
-            }
+        # Should use explicit default profile (overrides timeout, adds custom)
+        assert config == {
+            "host": "localhost",
+            "port": 5432,
+            "timeout": 60,
+            "custom": True,
+        }
 
-    def test_non_default_profile_still_raises_error(self):
+    def test_non_default_profile_still_raises_error(self, app_config):
         """Test that non-existent profiles (other than 'default') still raise errors."""
-        with tempfile.TemporaryDirectory() as tmpdir, chdir_context(tmpdir):
-            config_dir = Path(tmpdir) / "testapp"
-            config_dir.mkdir()
-            config_file = config_dir / "config.yaml"
-
-            config_file.write_text("""
+        app_config(
+            """
 defaults:
   host: localhost
 
 profiles:
   development:
     debug: true
-""")
+""",
+            name="testapp",
+        )
+
+        # Non-existent profile should still raise error
+        resolver = ProfileConfigResolver(
+            "testapp", profile="nonexistent", search_home=False
+        )
+
+        with pytest.raises(ProfileNotFoundError) as exc_info:
+            resolver.resolve()
+
+        assert "nonexistent" in str(exc_info.value)
+        assert "Available profiles" in str(exc_info.value)
+
+    def test_from_string(self):
+        """Test resolving configuration text without any files."""
+        resolver = ProfileConfigResolver.from_string(
+            """
+defaults:
+  host: localhost
+  port: 5432
 
-            # Non-existent profile should still raise error
-            resolver = ProfileConfigResolver(
-                "testapp", profile="nonexistent", search_home=False
+profiles:
+  base:
+    timeout: 30
+  dev:
+    inherits: base
+    port: 3000
+    url: "${host}:${port}"
+""",
+            profile="dev",
+        )
+
+        assert resolver.resolve() == {
+            "host": "localhost",
+            "port": 3000,
+            "timeout": 30,
+            "url": "localhost:3000",
+        }
+        assert set(resolver.list_profiles()) == {"base", "dev"}
+        assert resolver.get_config_files() == []
+
+    def test_from_string_json(self):
+        """Test resolving JSON configuration text."""
+        resolver = ProfileConfigResolver.from_string(
+            '{"defaults": {"debug": false}, "profiles": {"dev": {"debug": true}}}',
+            file_format="json",
+            profile="dev",
+        )
+
+        assert resolver.resolve() == {"debug": True}
+
+    def test_from_string_invalid(self):
+        """Test that unparsable text raises ConfigFormatError."""
+        with pytest.raises(ConfigFormatError):
+            ProfileConfigResolver.from_string("- just\n- a list\n")
+
+    def test_from_mapping_not_mutated(self):
+        """Test that resolving an in-memory mapping leaves it unchanged."""
+        config_data = {
+            "defaults": {"database": {"host": "localhost"}},
+            "profiles": {"dev": {"database": {"name": "dev_db"}}},
+        }
+
+        resolver = ProfileConfigResolver.from_mapping(config_data, profile="dev")
+        result = resolver.resolve()
+        result["database"]["host"] = "mutated"
+
+        assert resolver.resolve()["database"] == {
+            "host": "localhost",
+            "name": "dev_db",
+        }
+        assert config_data["defaults"] == {"database": {"host": "localhost"}}
+
+    def test_resolve_many(self, app_config):
+        """Test resolving several profiles in one call."""
+        app_config(
+            """
+defaults:
+  host: localhost
+  env_vars:
+    APP_MODE: base
+
+profiles:
+  base:
+    port: 5432
+  dev:
+    inherits: base
+    debug: true
+  prod:
+    inherits: base
+    host: prod.example.com
+""",
+            name="testapp",
+        )
+
+        resolver = ProfileConfigResolver("testapp", search_home=False)
+        results = resolver.resolve_many(["dev", "prod"])
+
+        assert results == {
+            "dev": {
+                "host": "localhost",
+                "port": 5432,
+                "debug": True,
+                "env_vars": {"APP_MODE": "base"},
+            },
+            "prod": {
+                "host": "prod.example.com",
+                "port": 5432,
+                "env_vars": {"APP_MODE": "base"},
+            },
+        }
+        assert resolver.get_environment_info()["applied"] == {}
+
+    def test_resolve_many_loads_files_once(self, monkeypatch):
+        """Test that files are loaded and merged once for all profiles."""
+        resolver = ProfileConfigResolver.from_mapping(
+            {"profiles": {"a": {"key": 1}, "b": {"key": 2}, "c": {"key": 3}}}
+        )
+        calls = []
+        load_merged_config = ProfileConfigResolver._load_merged_config
+
+        def counting_load(self, config_files):
+            calls.append(config_files)
+            return load_merged_config(self, config_files)
+
+        monkeypatch.setattr(ProfileConfigResolver, "_load_merged_config", counting_load)
+        results = resolver.resolve_many(["a", "b", "c"])
+
+        assert {name: config["key"] for name, config in results.items()} == {
+            "a": 1,
+            "b": 2,
+            "c": 3,
+        }
+        assert len(calls) == 1
+
+    def test_profile_not_copied_again_without_overrides(self, monkeypatch):
+        """Test that the resolved profile is only interpolated when there are no overrides."""
+        resolver = ProfileConfigResolver.from_mapping(
+            {
+                "defaults": {"base": "/app", "data": "${base}/data"},
+                "profiles": {"dev": {"debug": True}},
+            },
+            profile="dev",
+        )
+        calls = []
+        merge_configs = ConfigMerger.merge_configs
+
+        def counting_merge(self, *sources, **kwargs):
+            calls.append(sources)
+            return merge_configs(self, *sources, **kwargs)
+
+        monkeypatch.setattr(ConfigMerger, "merge_configs", counting_merge)
+        result = resolver.resolve()
+
+        assert result == {"base": "/app", "data": "/app/data", "debug": True}
+        # Merging the files and resolving the profile; nothing after that
+        assert len(calls) == 2
+
+    def test_profile_returned_as_is_without_overrides_or_interpolation(
+        self, monkeypatch
+    ):
+        """Test that nothing runs after profile resolution when both are off."""
+        resolver = ProfileConfigResolver.from_mapping(
+            {"defaults": {"path": "${base}"}, "profiles": {"dev": {"debug": True}}},
+            profile="dev",
+            enable_interpolation=False,
+        )
+        profile_config = {"path": "${base}", "debug": True}
+
+        def fail(self, *args, **kwargs):
+            raise AssertionError("resolved profile was merged again")
+
+        monkeypatch.setattr(ConfigMerger, "interpolate", fail)
+        monkeypatch.setattr(ConfigMerger, "merge_configs", fail)
+
+        assert resolver._apply_overrides(profile_config, []) == {
+            "path": "${base}",
+            "debug": True,
+        }
+
+    def test_resolve_other_profile(self):
+        """Test resolving a profile other than the resolver's own."""
+        resolver = ProfileConfigResolver.from_mapping(
+            {"defaults": {"key": 0}, "profiles": {"a": {"key": 1}, "b": {"key": 2}}},
+            profile="a",
+        )
+
+        assert resolver.resolve(profile="b") == {"key": 2}
+        assert resolver.resolve() == {"key": 1}
+        assert resolver.profile == "a"
+
+        with pytest.raises(ProfileNotFoundError):
+            resolver.resolve(profile="missing")
+
+    def test_resolve_many_nonexistent_profile(self):
+        """Test that an unknown profile raises ProfileNotFoundError."""
+        resolver = ProfileConfigResolver.from_mapping({"profiles": {"dev": {}}})
+
+        with pytest.raises(ProfileNotFoundError):
+            resolver.resolve_many(["dev", "missing"])
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_resolve_parallel(self, app_config, use_processes):
+        """Test resolving several applications concurrently."""
+        for app in ["app_a", "app_b"]:
+            app_config(
+                f"""
+defaults:
+  name: {app}
+  env_vars:
+    PARALLEL_APP: {app}
+profiles:
+  dev:
+    debug: true
+""",
+                name=app,
             )
 
-            with pytest.raises(ProfileNotFoundError) as exc_info:
-                resolver.resolve()
+        os.environ.pop("PARALLEL_APP", None)
+        try:
+            resolvers = [
+                ProfileConfigResolver("app_a", profile="dev", search_home=False),
+                ProfileConfigResolver("app_b", search_home=False),
+            ]
+            results = ProfileConfigResolver.resolve_parallel(
+                resolvers, max_workers=2, use_processes=use_processes
+            )
 
-            assert "nonexistent" in str(exc_info.value)
-            assert "Available profiles" in str(exc_info.value)
+            assert results == [{"name": "app_a", "debug": True}, {"name": "app_b"}]
+            # Environment variables are applied here, first resolver first
+            assert os.environ["PARALLEL_APP"] == "app_a"
+            assert resolvers[1].get_environment_info()["skipped"] == {
+                "PARALLEL_APP": "app_b"
+            }
+        finally:
+            os.environ.pop("PARALLEL_APP", None)